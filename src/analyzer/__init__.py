@@ -4,6 +4,7 @@ from .clang_analyzer import ClangAnalyzer, ClangParseError
 from .function_extractor import FunctionExtractor
 from .caller_tracker import CallerTracker
 from .symbol_resolver import SymbolResolver
+from .ast_prewarm import FileSummary, parse_file_summary, prewarm_ast_cache
 
 __all__ = [
     "ClangAnalyzer",
@@ -11,4 +12,7 @@ __all__ = [
     "FunctionExtractor",
     "CallerTracker",
     "SymbolResolver",
+    "FileSummary",
+    "parse_file_summary",
+    "prewarm_ast_cache",
 ]
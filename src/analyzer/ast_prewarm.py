@@ -0,0 +1,139 @@
+"""Clang ASTのプロセス並列な事前解析。
+
+libclangのパースはCPUバウンドかつファイル単位で独立しているため、
+LLMループに入る前にProcessPoolExecutorで並列に事前解析し、
+pickle可能な要約（関数テーブル）をキャッシュとして構築する。
+TranslationUnit自体はpickleできないため、要約のみを親プロセスに返す。
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+import logging
+import os
+
+from ..models.context import FunctionInfo
+
+logger = logging.getLogger(__name__)
+
+# ワーカープロセスごとのFunctionExtractor（initializerで初期化）
+_worker_extractor = None
+
+
+@dataclass
+class FileSummary:
+    """1ファイル分のAST要約。
+
+    pickle可能なデータのみを保持し、ワーカープロセスから
+    親プロセスへ返却できるようにする。
+    """
+    file_path: str
+    functions: List[FunctionInfo] = field(default_factory=list)
+    parse_error: Optional[str] = None
+
+
+def _init_worker(include_paths: List[str], compiler_args: List[str]) -> None:
+    """ワーカープロセスの初期化（プロセスごとに1回）。
+
+    Args:
+        include_paths: インクルードディレクトリのリスト
+        compiler_args: 追加のコンパイラ引数
+    """
+    global _worker_extractor
+
+    from .clang_analyzer import ClangAnalyzer
+    from .function_extractor import FunctionExtractor
+
+    analyzer = ClangAnalyzer(
+        include_paths=include_paths,
+        additional_args=compiler_args
+    )
+    _worker_extractor = FunctionExtractor(analyzer)
+
+
+def parse_file_summary(file_path: str) -> FileSummary:
+    """1ファイルを解析してAST要約を返す。
+
+    ProcessPoolExecutor.mapから呼ばれるためモジュールスコープに置く。
+    _init_workerが呼ばれていない場合（逐次実行）は遅延初期化する。
+
+    Args:
+        file_path: 解析するソースファイルのパス
+
+    Returns:
+        FileSummary（解析失敗時はparse_errorを設定）
+    """
+    global _worker_extractor
+
+    if _worker_extractor is None:
+        _init_worker([], [])
+
+    try:
+        functions = _worker_extractor.get_all_functions(file_path)
+        return FileSummary(
+            file_path=os.path.normpath(file_path),
+            functions=functions
+        )
+    except Exception as e:
+        return FileSummary(
+            file_path=os.path.normpath(file_path),
+            parse_error=str(e)
+        )
+
+
+def prewarm_ast_cache(
+    files: Iterable[str],
+    include_paths: List[str],
+    compiler_args: List[str],
+    max_workers: Optional[int] = None
+) -> Dict[str, FileSummary]:
+    """指摘対象ファイルのAST要約を並列に事前構築する。
+
+    Args:
+        files: 解析するソースファイルパスの集合
+        include_paths: インクルードディレクトリのリスト
+        compiler_args: 追加のコンパイラ引数
+        max_workers: ワーカープロセス数（省略時はCPUコア数）
+
+    Returns:
+        正規化ファイルパスからFileSummaryへの辞書
+    """
+    file_list = sorted({os.path.normpath(f) for f in files})
+    if not file_list:
+        return {}
+
+    workers = max_workers or os.cpu_count() or 1
+    workers = min(workers, len(file_list))
+
+    logger.info(
+        f"Pre-parsing {len(file_list)} files with {workers} worker(s)"
+    )
+
+    if workers == 1:
+        _init_worker(include_paths, compiler_args)
+        summaries = [parse_file_summary(f) for f in file_list]
+    else:
+        chunksize = max(1, len(file_list) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(include_paths, compiler_args)
+        ) as executor:
+            summaries = list(
+                executor.map(parse_file_summary, file_list, chunksize=chunksize)
+            )
+
+    cache: Dict[str, FileSummary] = {}
+    errors = 0
+    for summary in summaries:
+        cache[summary.file_path] = summary
+        if summary.parse_error:
+            errors += 1
+            logger.warning(
+                f"Pre-parse failed for {summary.file_path}: {summary.parse_error}"
+            )
+
+    logger.info(
+        f"AST cache ready: {len(cache) - errors}/{len(cache)} files parsed"
+    )
+    return cache
@@ -1,11 +1,16 @@
 """libclangを使用したC++ソースファイルからの関数抽出。"""
 
 from typing import Optional, Tuple, Set
+import functools
 import logging
+import os
 
 from ..models.context import FunctionInfo
 from .clang_analyzer import ClangAnalyzer
 
+# os.path.normpathのメモ化版（AST走査中にノードごとの比較で呼ばれる）
+_normpath_cached = functools.lru_cache(maxsize=4096)(os.path.normpath)
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,6 +27,9 @@ class FunctionExtractor:
         "LAMBDA_EXPR",
     }
 
+    # 行キャッシュに保持する最大ファイル数
+    _LINE_CACHE_SIZE = 8
+
     def __init__(self, clang_analyzer: ClangAnalyzer):
         """関数抽出器を初期化する。
 
@@ -30,6 +38,38 @@ class FunctionExtractor:
         """
         self.analyzer = clang_analyzer
         self._ci = clang_analyzer.ci
+        # ファイルパス→行リストのキャッシュ
+        # 同一ファイル内の複数関数を抽出する際にファイルを1回だけ読む
+        self._line_cache: dict = {}
+
+    def _get_lines(self, file_path: str) -> Optional[list]:
+        """ファイルの行リストを取得する（キャッシュ付き）。
+
+        1ファイルの全関数抽出などで同じファイルを関数ごとに
+        読み直さないよう、直近のファイルを行リストで保持する。
+
+        Args:
+            file_path: ソースファイルのパス
+
+        Returns:
+            行のリスト、読み込み失敗時はNone
+        """
+        lines = self._line_cache.get(file_path)
+        if lines is not None:
+            return lines
+
+        try:
+            with open(file_path, "r", encoding="utf-8", errors="replace") as f:
+                lines = f.readlines()
+        except Exception as e:
+            logger.warning(f"Failed to read {file_path}: {e}")
+            return None
+
+        # 古いエントリから追い出す（挿入順＝アクセスの近さで十分）
+        if len(self._line_cache) >= self._LINE_CACHE_SIZE:
+            self._line_cache.pop(next(iter(self._line_cache)))
+        self._line_cache[file_path] = lines
+        return lines
 
     def extract_function_at_line(
         self,
@@ -89,6 +129,9 @@ class FunctionExtractor:
             CursorKind.FUNCTION_TEMPLATE,
         }
 
+        # 対象パスは走査前に1回だけ正規化する
+        target_path = _normpath_cached(file_path)
+
         def traverse(node):
             nonlocal result
 
@@ -96,8 +139,7 @@ class FunctionExtractor:
             if node.location.file:
                 node_file = node.location.file.name
                 # 比較のためにパスを正規化
-                import os
-                if os.path.normpath(node_file) != os.path.normpath(file_path):
+                if _normpath_cached(node_file) != target_path:
                     return
 
             # 対象行を含む関数かどうかをチェック
@@ -194,18 +236,13 @@ class FunctionExtractor:
         Returns:
             ソースコード文字列
         """
-        try:
-            with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-                lines = f.readlines()
-
-            # 0始まりに変換
-            selected_lines = lines[start_line - 1:end_line]
-            return "".join(selected_lines)
-
-        except Exception as e:
-            logger.warning(f"Failed to read {file_path}:{start_line}-{end_line}: {e}")
+        lines = self._get_lines(file_path)
+        if lines is None:
             return ""
 
+        # 0始まりに変換
+        return "".join(lines[start_line - 1:end_line])
+
     def extract_function_with_context(
         self,
         file_path: str,
@@ -231,8 +268,9 @@ class FunctionExtractor:
 
         # 関数が見つからない場合、コンテキスト行を読み込む
         try:
-            with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-                lines = f.readlines()
+            lines = self._get_lines(file_path)
+            if lines is None:
+                return None, ""
 
             start = max(0, line - context_lines - 1)
             end = min(len(lines), line + context_lines)
@@ -279,12 +317,14 @@ class FunctionExtractor:
             CursorKind.DESTRUCTOR,
         }
 
+        # 対象パスは走査前に1回だけ正規化する
+        target_path = _normpath_cached(file_path)
+
         def traverse(node):
-            import os
             # 他のファイルのノードをスキップ
             if node.location.file:
                 node_file = node.location.file.name
-                if os.path.normpath(node_file) != os.path.normpath(file_path):
+                if _normpath_cached(node_file) != target_path:
                     return
 
             if node.kind in function_kinds and node.is_definition():
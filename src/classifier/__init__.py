@@ -1,6 +1,13 @@
 """LLMベースの分類モジュール。"""
 
-from .llm_client import LLMClient, LLMConfig, LLMError, ClassificationResponse
+from .llm_client import (
+    LLMClient,
+    LLMConfig,
+    LLMError,
+    ClassificationResponse,
+    BatchClassificationItem,
+    BatchClassificationResponse,
+)
 from .prompt_builder import PromptBuilder
 from .response_parser import ResponseParser
 
@@ -9,6 +16,8 @@ __all__ = [
     "LLMConfig",
     "LLMError",
     "ClassificationResponse",
+    "BatchClassificationItem",
+    "BatchClassificationResponse",
     "PromptBuilder",
     "ResponseParser",
 ]
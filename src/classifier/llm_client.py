@@ -1,14 +1,17 @@
 """分類用Azure OpenAI APIクライアント。"""
 
-from typing import Optional
+from typing import List, Optional, Type
 from dataclasses import dataclass
 from enum import Enum
 import time
 import logging
 
+import orjson
 from openai import AzureOpenAI
 from pydantic import BaseModel, Field
 
+from ..utils.rate_limiter import TokenBucket
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,6 +45,22 @@ class ClassificationResponse(BaseModel):
     )
 
 
+class BatchClassificationItem(ClassificationResponse):
+    """バッチ分類レスポンス内の1件分の判定結果。"""
+
+    id: str = Field(
+        description="対応する指摘ID（プロンプト内のIDをそのまま返す）"
+    )
+
+
+class BatchClassificationResponse(BaseModel):
+    """複数指摘の一括分類用の構造化出力モデル。"""
+
+    items: List[BatchClassificationItem] = Field(
+        description="プロンプト内の全指摘に対する判定結果のリスト"
+    )
+
+
 @dataclass
 class LLMConfig:
     """LLMクライアントの設定。"""
@@ -51,7 +70,8 @@ class LLMConfig:
     deployment_name: str = "gpt-5-mini"
     max_tokens: int = 4096
     temperature: float = 0.1  # 一貫性のための低い温度
-    request_delay: float = 1.0  # リクエスト間の遅延（秒）
+    request_delay: float = 1.0  # リクエスト間の平均間隔（秒）
+    burst_size: float = 3.0  # 間隔が空いた後に連続で送れるリクエスト数
 
 
 class LLMError(Exception):
@@ -74,7 +94,14 @@ class LLMClient:
             api_key=config.api_key,
             api_version=config.api_version
         )
-        self._last_request_time = 0.0
+
+        # トークンバケットでレート制限（request_delay <= 0で無効）
+        self._rate_limiter: Optional[TokenBucket] = None
+        if config.request_delay > 0:
+            self._rate_limiter = TokenBucket(
+                rate=1.0 / config.request_delay,
+                capacity=config.burst_size
+            )
 
         logger.info(
             f"LLMClient initialized with deployment: {config.deployment_name}"
@@ -84,17 +111,19 @@ class LLMClient:
         self,
         system_prompt: str,
         user_prompt: str,
-        max_retries: int = 3
-    ) -> Optional[ClassificationResponse]:
+        max_retries: int = 3,
+        response_model: Type[BaseModel] = ClassificationResponse
+    ) -> Optional[BaseModel]:
         """静的解析の指摘を分類する。
 
         Args:
             system_prompt: 分類タスクを定義するシステムプロンプト
             user_prompt: コードと指摘情報を含むユーザープロンプト
             max_retries: 最大リトライ回数
+            response_model: 構造化出力のスキーマ（単件またはバッチ）
 
         Returns:
-            ClassificationResponse、失敗時はNone
+            response_modelのインスタンス、失敗時はNone
         """
         self._wait_for_rate_limit()
 
@@ -106,23 +135,34 @@ class LLMClient:
                         {"role": "system", "content": system_prompt},
                         {"role": "user", "content": user_prompt}
                     ],
-                    response_format=ClassificationResponse,
+                    response_format=response_model,
                     max_tokens=self.config.max_tokens,
                     temperature=self.config.temperature
                 )
 
-                self._last_request_time = time.time()
-
                 # パース済み結果を取得
                 parsed = response.choices[0].message.parsed
 
                 if parsed:
-                    logger.debug(
-                        f"Classification: {parsed.classification.value} "
-                        f"(confidence: {parsed.confidence:.0%})"
-                    )
+                    if isinstance(parsed, ClassificationResponse):
+                        logger.debug(
+                            f"Classification: {parsed.classification.value} "
+                            f"(confidence: {parsed.confidence:.0%})"
+                        )
                     return parsed
 
+                # 構造化パースが得られない場合は生のJSONをorjsonでデコード
+                content = response.choices[0].message.content
+                if content:
+                    try:
+                        return response_model.model_validate(
+                            orjson.loads(content)
+                        )
+                    except (ValueError, TypeError) as parse_error:
+                        logger.warning(
+                            f"Failed to decode raw LLM response: {parse_error}"
+                        )
+
                 logger.warning("Empty response from LLM")
                 return None
 
@@ -176,10 +216,12 @@ class LLMClient:
 
     def _wait_for_rate_limit(self) -> None:
         """レート制限を遵守するために必要に応じて待機する。"""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.config.request_delay:
-            sleep_time = self.config.request_delay - elapsed
-            time.sleep(sleep_time)
+        if self._rate_limiter is None:
+            return
+
+        waited = self._rate_limiter.acquire()
+        if waited > 0:
+            logger.debug(f"Rate limiter waited {waited:.2f}s")
 
     def test_connection(self) -> bool:
         """API接続をテストする。
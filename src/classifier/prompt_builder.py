@@ -1,6 +1,6 @@
 """LLM分類用のプロンプトビルダー。"""
 
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 import logging
 
 from ..models.finding import Finding
@@ -9,24 +9,8 @@ from ..models.context import AnalysisContext, RuleInfo
 logger = logging.getLogger(__name__)
 
 
-class PromptBuilder:
-    """LLM分類用のプロンプトを構築する。"""
-
-    def __init__(self, rules_db: Optional[Dict[str, RuleInfo]] = None):
-        """プロンプトビルダーを初期化する。
-
-        Args:
-            rules_db: ルールIDからRuleInfoへの辞書
-        """
-        self.rules_db = rules_db or {}
-
-    def build_system_prompt(self) -> str:
-        """システムプロンプトを構築する。
-
-        Returns:
-            システムプロンプト文字列
-        """
-        return """あなたは車載組み込みソフトウェアの静的解析結果を評価する専門家です。
+# システムプロンプトは実行中不変のためモジュールロード時に1回だけ構築する
+_SYSTEM_PROMPT = """あなたは車載組み込みソフトウェアの静的解析結果を評価する専門家です。
 AUTOSAR C++14 Coding GuidelinesおよびCERT C++ Coding Standardに精通しています。
 
 あなたの役割は、静的解析ツール（CodeSonar）が検出した指摘を以下の3つに分類することです：
@@ -64,6 +48,51 @@ AUTOSAR C++14 Coding GuidelinesおよびCERT C++ Coding Standardに精通して
 ## 出力形式
 指定されたJSON形式で回答してください。"""
 
+# 融合呼び出し用のシステムプロンプト（自己エスカレーション指示付き）
+_FUSED_SYSTEM_PROMPT = _SYSTEM_PROMPT + """
+
+## 2段階判定の指示
+
+ユーザープロンプトには <<PHASE1_CONTEXT>>（対象関数のみ）と
+<<PHASE2_CONTEXT>>（呼び出し元・型定義・マクロ）の2つのセクションがあります。
+まず <<PHASE1_CONTEXT>> のみで判定し、確信度が0.8未満の場合は
+<<PHASE2_CONTEXT>> も踏まえて再判定した最終結果を回答してください。
+回答は最終的な1つの判定のみを返してください。"""
+
+
+class PromptBuilder:
+    """LLM分類用のプロンプトを構築する。"""
+
+    def __init__(self, rules_db: Optional[Dict[str, RuleInfo]] = None):
+        """プロンプトビルダーを初期化する。
+
+        Args:
+            rules_db: ルールIDからRuleInfoへの辞書
+        """
+        self.rules_db = rules_db or {}
+
+        # ルールIDからフォーマット済みテキストへのキャッシュ
+        self._rule_text_cache: Dict[str, str] = {}
+
+    def build_system_prompt(self) -> str:
+        """システムプロンプトを取得する。
+
+        Returns:
+            システムプロンプト文字列（モジュールロード時に構築済み）
+        """
+        return _SYSTEM_PROMPT
+
+    def build_fused_system_prompt(self) -> str:
+        """Phase 1/2融合呼び出し用のシステムプロンプトを取得する。
+
+        通常のシステムプロンプトに、確信度が低い場合は拡張コンテキストを
+        使って判定し直すよう指示する自己エスカレーション指示を追加したもの。
+
+        Returns:
+            システムプロンプト文字列（モジュールロード時に構築済み）
+        """
+        return _FUSED_SYSTEM_PROMPT
+
     def build_phase1_prompt(
         self,
         finding: Finding,
@@ -88,7 +117,7 @@ AUTOSAR C++14 Coding GuidelinesおよびCERT C++ Coding Standardに精通して
 **行番号**: {finding.location.line}
 **ルールID**: {finding.rule_id}
 **メッセージ**: {finding.message}
-**重要度**: {finding.severity.value}
+**重要度**: {finding.severity.label}
 
 ## ルール情報
 {rule_info}
@@ -114,6 +143,72 @@ AUTOSAR C++14 Coding GuidelinesおよびCERT C++ Coding Standardに精通して
 
         return prompt
 
+    def build_batched_phase1_prompt(
+        self,
+        findings: List[Finding],
+        contexts: Dict[str, AnalysisContext]
+    ) -> str:
+        """同一ルールの複数指摘をまとめたPhase 1プロンプトを構築する。
+
+        ルール情報などの共通プレフィックスを1回だけ送信し、
+        指摘ごとのコードをID付きアイテムとして列挙する。
+
+        Args:
+            findings: 同一ルールIDの指摘リスト
+            contexts: 指摘IDから解析コンテキストへの辞書
+
+        Returns:
+            ユーザープロンプト文字列
+        """
+        first = findings[0]
+        rule_info = self._get_rule_info(
+            first.rule_id, contexts[first.id].rule_info
+        )
+
+        item_sections = []
+        for finding in findings:
+            context = contexts[finding.id]
+            relative_line = (
+                finding.location.line - context.target_function.start_line + 1
+            )
+
+            item_sections.append(f"""### 指摘 {finding.id}
+
+**ファイル**: {finding.location.file_path}
+**行番号**: {finding.location.line}
+**メッセージ**: {finding.message}
+**重要度**: {finding.severity.label}
+
+```cpp
+// ファイル: {context.target_function.file_path}
+// 関数: {context.target_function.name}
+// 行 {context.target_function.start_line} - {context.target_function.end_line}
+
+{context.target_function.code}
+```
+
+**指摘箇所**: 上記コード内の {relative_line} 行目付近
+""")
+
+        items_text = "\n".join(item_sections)
+
+        prompt = f"""## 静的解析の指摘情報（一括判定）
+
+以下は同一ルール（**{first.rule_id}**）に対する {len(findings)} 件の指摘です。
+
+## ルール情報
+{rule_info}
+
+## 指摘一覧
+{items_text}
+## 判定してください
+
+各指摘を個別に分析し、FALSE_POSITIVE（誤検知）、DEVIATION（逸脱）、FIX_REQUIRED（修正）のいずれかに分類してください。
+itemsには必ず全指摘（{len(findings)}件）の結果を、プロンプト内のID（例: {first.id}）をidに設定して含めてください。
+確信度と詳細な理由も指摘ごとに含めてください。"""
+
+        return prompt
+
     def build_phase2_prompt(
         self,
         finding: Finding,
@@ -132,6 +227,115 @@ AUTOSAR C++14 Coding GuidelinesおよびCERT C++ Coding Standardに精通して
 
         relative_line = finding.location.line - context.target_function.start_line + 1
 
+        additional_sections = self._build_additional_sections(context)
+
+        prompt = f"""## 静的解析の指摘情報
+
+**ファイル**: {finding.location.file_path}
+**行番号**: {finding.location.line}
+**ルールID**: {finding.rule_id}
+**メッセージ**: {finding.message}
+**重要度**: {finding.severity.label}
+
+## ルール情報
+{rule_info}
+
+## 対象コード（指摘箇所を含む関数）
+
+```cpp
+// ファイル: {context.target_function.file_path}
+// 関数: {context.target_function.name}
+// 行 {context.target_function.start_line} - {context.target_function.end_line}
+
+{context.target_function.code}
+```
+
+**指摘箇所**: 上記コード内の {relative_line} 行目付近
+{additional_sections}
+## 追加コンテキストを踏まえた判定
+
+Phase 1では確信度が低かったため、追加のコンテキスト（呼び出し元、型定義、マクロ）を提供しています。
+これらの情報を踏まえて、再度分類を行ってください。
+
+特に以下の点に注目してください：
+1. 呼び出し元でのパラメータの使われ方
+2. 型定義から分かる制約や意図
+3. マクロの展開結果がコードに与える影響"""
+
+        return prompt
+
+    def build_fused_prompt(
+        self,
+        finding: Finding,
+        phase1_context: AnalysisContext,
+        phase2_context: AnalysisContext
+    ) -> str:
+        """Phase 1/2を1回のLLM呼び出しに融合したプロンプトを構築する。
+
+        Phase 1とPhase 2のコンテキストをラベル付きセクションで結合し、
+        低確信度の指摘に対する2回目の往復を不要にする。
+        build_fused_system_prompt()と組み合わせて使用する。
+
+        Args:
+            finding: 分類する指摘
+            phase1_context: 対象関数のみのコンテキスト
+            phase2_context: 追加情報を含むコンテキスト
+
+        Returns:
+            ユーザープロンプト文字列
+        """
+        rule_info = self._get_rule_info(finding.rule_id, phase1_context.rule_info)
+
+        relative_line = (
+            finding.location.line - phase1_context.target_function.start_line + 1
+        )
+
+        additional_sections = self._build_additional_sections(phase2_context)
+
+        prompt = f"""## 静的解析の指摘情報
+
+**ファイル**: {finding.location.file_path}
+**行番号**: {finding.location.line}
+**ルールID**: {finding.rule_id}
+**メッセージ**: {finding.message}
+**重要度**: {finding.severity.label}
+
+## ルール情報
+{rule_info}
+
+<<PHASE1_CONTEXT>>
+
+## 対象コード（指摘箇所を含む関数）
+
+```cpp
+// ファイル: {phase1_context.target_function.file_path}
+// 関数: {phase1_context.target_function.name}
+// 行 {phase1_context.target_function.start_line} - {phase1_context.target_function.end_line}
+
+{phase1_context.target_function.code}
+```
+
+**指摘箇所**: 上記コード内の {relative_line} 行目付近
+
+<<PHASE2_CONTEXT>>
+{additional_sections}
+## 判定してください
+
+まず対象関数のみ（<<PHASE1_CONTEXT>>）で判定し、確信度が0.8未満の場合は
+追加コンテキスト（<<PHASE2_CONTEXT>>）も踏まえて再判定してください。
+最終的な分類・確信度・詳細な理由を回答してください。"""
+
+        return prompt
+
+    def _build_additional_sections(self, context: AnalysisContext) -> str:
+        """呼び出し元・型定義・マクロのセクションを構築する。
+
+        Args:
+            context: 追加情報を含む解析コンテキスト
+
+        Returns:
+            結合されたセクション文字列（情報がない場合は空文字列）
+        """
         # 呼び出し元関数セクションを構築
         caller_section = ""
         if context.caller_functions:
@@ -168,40 +372,7 @@ AUTOSAR C++14 Coding GuidelinesおよびCERT C++ Coding Standardに精通して
             for macro in context.related_macros:
                 macro_section += f"- `{macro.definition}` ({macro.file_path}:{macro.line})\n"
 
-        prompt = f"""## 静的解析の指摘情報
-
-**ファイル**: {finding.location.file_path}
-**行番号**: {finding.location.line}
-**ルールID**: {finding.rule_id}
-**メッセージ**: {finding.message}
-**重要度**: {finding.severity.value}
-
-## ルール情報
-{rule_info}
-
-## 対象コード（指摘箇所を含む関数）
-
-```cpp
-// ファイル: {context.target_function.file_path}
-// 関数: {context.target_function.name}
-// 行 {context.target_function.start_line} - {context.target_function.end_line}
-
-{context.target_function.code}
-```
-
-**指摘箇所**: 上記コード内の {relative_line} 行目付近
-{caller_section}{type_section}{macro_section}
-## 追加コンテキストを踏まえた判定
-
-Phase 1では確信度が低かったため、追加のコンテキスト（呼び出し元、型定義、マクロ）を提供しています。
-これらの情報を踏まえて、再度分類を行ってください。
-
-特に以下の点に注目してください：
-1. 呼び出し元でのパラメータの使われ方
-2. 型定義から分かる制約や意図
-3. マクロの展開結果がコードに与える影響"""
-
-        return prompt
+        return f"{caller_section}{type_section}{macro_section}"
 
     def _get_rule_info(
         self,
@@ -221,17 +392,24 @@ Phase 1では確信度が低かったため、追加のコンテキスト（呼
         if context_rule_info:
             return context_rule_info.to_prompt_text()
 
+        # 同一ルールの再フォーマットを避けるためキャッシュを参照
+        cached = self._rule_text_cache.get(rule_id)
+        if cached is not None:
+            return cached
+
         # ルールデータベースで検索
         normalized_id = self._normalize_rule_id(rule_id)
 
         if rule_id in self.rules_db:
-            return self.rules_db[rule_id].to_prompt_text()
-
-        if normalized_id in self.rules_db:
-            return self.rules_db[normalized_id].to_prompt_text()
+            text = self.rules_db[rule_id].to_prompt_text()
+        elif normalized_id in self.rules_db:
+            text = self.rules_db[normalized_id].to_prompt_text()
+        else:
+            # フォールバックメッセージ
+            text = f"※ルール {rule_id} の詳細情報はデータベースにありません。指摘メッセージを参考に判定してください。"
 
-        # フォールバックメッセージ
-        return f"※ルール {rule_id} の詳細情報はデータベースにありません。指摘メッセージを参考に判定してください。"
+        self._rule_text_cache[rule_id] = text
+        return text
 
     def _normalize_rule_id(self, rule_id: str) -> str:
         """ルールIDを正規化する。
@@ -259,4 +437,5 @@ Phase 1では確信度が低かったため、追加のコンテキスト（呼
             rules_db: ルールIDからRuleInfoへの辞書
         """
         self.rules_db = rules_db
+        self._rule_text_cache.clear()
         logger.info(f"Rules database set with {len(rules_db)} rules")
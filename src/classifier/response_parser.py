@@ -1,10 +1,17 @@
 """LLM分類結果のレスポンスパーサー。"""
 
-from typing import Optional
+from typing import Dict, Optional, Union
 import logging
+import re
+
+from pydantic import ValidationError
 
 from ..models.classification import ClassificationResult, ClassificationType
-from .llm_client import ClassificationResponse, ClassificationTypeEnum
+from .llm_client import (
+    BatchClassificationResponse,
+    ClassificationResponse,
+    ClassificationTypeEnum,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +19,9 @@ logger = logging.getLogger(__name__)
 class ResponseParser:
     """LLMレスポンスをClassificationResultオブジェクトにパースする。"""
 
+    # Markdownコードフェンスに包まれたJSONを抽出するパターン（事前コンパイル）
+    _JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
     # LLM列挙から内部列挙へのマッピング
     TYPE_MAPPING = {
         ClassificationTypeEnum.FALSE_POSITIVE: ClassificationType.FALSE_POSITIVE,
@@ -22,20 +32,23 @@ class ResponseParser:
 
     def parse(
         self,
-        response: ClassificationResponse,
+        response: Union[ClassificationResponse, str, bytes],
         finding_id: str,
         phase: int
     ) -> ClassificationResult:
         """LLMレスポンスをClassificationResultにパースする。
 
         Args:
-            response: LLMレスポンスオブジェクト
+            response: LLMレスポンスオブジェクト、または生のJSON文字列
             finding_id: 分類対象の指摘ID
             phase: 分類フェーズ（1または2）
 
         Returns:
             ClassificationResultオブジェクト
         """
+        if isinstance(response, (str, bytes)):
+            response = self._decode_raw(response, ClassificationResponse)
+
         # 分類タイプをマッピング
         classification_type = self.TYPE_MAPPING.get(
             response.classification,
@@ -55,6 +68,62 @@ class ResponseParser:
             code_context_summary=response.code_analysis
         )
 
+    def parse_batch(
+        self,
+        response: Union[BatchClassificationResponse, str, bytes],
+        phase: int
+    ) -> Dict[str, ClassificationResult]:
+        """バッチ分類レスポンスを指摘IDごとの結果にパースする。
+
+        Args:
+            response: バッチ分類レスポンスオブジェクト、または生のJSON文字列
+            phase: 分類フェーズ（1または2）
+
+        Returns:
+            指摘IDからClassificationResultへの辞書
+        """
+        if isinstance(response, (str, bytes)):
+            response = self._decode_raw(response, BatchClassificationResponse)
+
+        results: Dict[str, ClassificationResult] = {}
+
+        for item in response.items:
+            if not item.id:
+                logger.warning("Batch response item without id, skipping")
+                continue
+            results[item.id] = self.parse(item, item.id, phase)
+
+        return results
+
+    @classmethod
+    def _decode_raw(cls, raw: Union[str, bytes], model):
+        """生のJSONレスポンスをpydanticモデルに直接変換する。
+
+        model_validate_json（pydantic-coreのRust実装）でJSONパースと
+        バリデーションを1パスで行い、中間dictの生成を省く。
+        LLMがJSONをMarkdownコードフェンスで包んで返した場合は、
+        事前コンパイル済みの正規表現で本体を抽出して再試行する。
+
+        Args:
+            raw: 生のJSON文字列またはバイト列
+            model: 変換先のpydanticモデルクラス
+
+        Returns:
+            モデルのインスタンス
+
+        Raises:
+            pydantic.ValidationError: JSONとして解釈できない場合
+        """
+        try:
+            return model.model_validate_json(raw)
+        except ValidationError:
+            text = raw.decode("utf-8", errors="replace") \
+                if isinstance(raw, bytes) else raw
+            match = cls._JSON_FENCE_RE.search(text)
+            if match is None:
+                raise
+            return model.model_validate_json(match.group(1))
+
     def _build_reason(self, response: ClassificationResponse) -> str:
         """レスポンスから統合された理由文字列を構築する。
 
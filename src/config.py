@@ -35,6 +35,12 @@ class Config:
     request_delay: float = 1.0  # API呼び出し間の遅延（秒）
     max_input_tokens: int = 250000  # 最大入力トークン数
 
+    # Phase 2に進む可能性が高いルールID（融合呼び出しで2回目の往復を省略）
+    phase2_likely_rules: List[str] = field(default_factory=list)
+
+    # 同一ルールの指摘を1回のLLM呼び出しにまとめる件数（1で無効）
+    batch_size: int = 8
+
     # ルールソース設定
     rules_source: Dict[str, Any] = field(default_factory=dict)
 
@@ -93,6 +99,8 @@ class Config:
             "max_input_tokens",
             config.max_input_tokens
         )
+        config.phase2_likely_rules = data.get("phase2_likely_rules") or []
+        config.batch_size = data.get("batch_size", config.batch_size)
 
         # ルールソース
         config.rules_source = data.get("rules_source", {})
@@ -162,6 +170,8 @@ class Config:
             "confidence_threshold": self.confidence_threshold,
             "request_delay": self.request_delay,
             "max_input_tokens": self.max_input_tokens,
+            "phase2_likely_rules": self.phase2_likely_rules,
+            "batch_size": self.batch_size,
             "rules_source": self.rules_source,
             "log_level": self.log_level,
             "log_file": self.log_file,
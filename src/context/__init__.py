@@ -1,6 +1,6 @@
 """コンテキスト構築・最適化モジュール。"""
 
 from .context_builder import ContextBuilder
-from .token_optimizer import TokenOptimizer
+from .token_optimizer import TokenOptimizer, estimate_tokens_bulk
 
-__all__ = ["ContextBuilder", "TokenOptimizer"]
+__all__ = ["ContextBuilder", "TokenOptimizer", "estimate_tokens_bulk"]
@@ -2,6 +2,7 @@
 
 from typing import List, Optional, Dict
 import logging
+import os
 
 from ..models.finding import Finding
 from ..models.context import AnalysisContext, FunctionInfo, RuleInfo
@@ -9,6 +10,7 @@ from ..analyzer.clang_analyzer import ClangAnalyzer
 from ..analyzer.function_extractor import FunctionExtractor
 from ..analyzer.caller_tracker import CallerTracker
 from ..analyzer.symbol_resolver import SymbolResolver
+from ..analyzer.ast_prewarm import FileSummary
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +35,9 @@ class ContextBuilder:
         self.source_files = source_files
         self.rules_db = rules_db or {}
 
+        # 事前解析されたAST要約（ファイルパス→FileSummary）
+        self._ast_cache: Dict[str, FileSummary] = {}
+
         self.function_extractor = FunctionExtractor(clang_analyzer)
         self.caller_tracker = CallerTracker(clang_analyzer, source_files)
         self.symbol_resolver = SymbolResolver(clang_analyzer)
@@ -53,12 +58,19 @@ class ContextBuilder:
         Returns:
             AnalysisContext、抽出失敗時はNone
         """
-        # 指摘を含む関数を抽出
-        func_info = self.function_extractor.extract_function_at_line(
+        # 事前解析キャッシュから関数を検索（メインループ内の同期パースを回避）
+        func_info = self._lookup_cached_function(
             finding.location.file_path,
             finding.location.line
         )
 
+        # キャッシュにない場合は同期パースにフォールバック
+        if func_info is None:
+            func_info = self.function_extractor.extract_function_at_line(
+                finding.location.file_path,
+                finding.location.line
+            )
+
         if func_info is None:
             # フォールバックとしてコンテキスト行を取得
             func_info, code = self.function_extractor.extract_function_with_context(
@@ -150,6 +162,42 @@ class ContextBuilder:
 
         return context
 
+    def set_ast_cache(self, ast_cache: Dict[str, FileSummary]) -> None:
+        """事前解析されたAST要約キャッシュを設定する。
+
+        Args:
+            ast_cache: 正規化ファイルパスからFileSummaryへの辞書
+        """
+        self._ast_cache = ast_cache
+        logger.info(f"AST cache set with {len(ast_cache)} files")
+
+    def _lookup_cached_function(
+        self,
+        file_path: str,
+        line: int
+    ) -> Optional[FunctionInfo]:
+        """AST要約キャッシュから指定行を含む関数を検索する。
+
+        Args:
+            file_path: ソースファイルのパス
+            line: 対象行番号（1始まり）
+
+        Returns:
+            FunctionInfo、キャッシュミスまたは関数なしの場合はNone
+        """
+        if not self._ast_cache:
+            return None
+
+        summary = self._ast_cache.get(os.path.normpath(file_path))
+        if summary is None or summary.parse_error:
+            return None
+
+        for func in summary.functions:
+            if func.start_line <= line <= func.end_line:
+                return func
+
+        return None
+
     def _get_rule_info(self, rule_id: str) -> Optional[RuleInfo]:
         """データベースからルール情報を取得する。
 
@@ -5,9 +5,54 @@ import logging
 
 from ..models.context import AnalysisContext, FunctionInfo
 
+# numpyは任意依存（pandas経由で通常は入っている）
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 logger = logging.getLogger(__name__)
 
 
+def estimate_tokens_bulk(contexts: List[AnalysisContext]) -> List[int]:
+    """複数コンテキストのトークン数をまとめて推定する。
+
+    各コンテキストのcode_lengths()を1本の配列に連結し、
+    np.add.reduceatの1回のC実装リダクションでコンテキストごとの
+    合計を求める。numpyが無い場合は個別のestimate_tokens()に
+    フォールバックする。結果は各コンテキストにキャッシュされる。
+
+    Args:
+        contexts: 解析コンテキストのリスト
+
+    Returns:
+        コンテキストごとの推定トークン数のリスト
+    """
+    if not contexts:
+        return []
+
+    if np is None:
+        return [context.estimate_tokens() for context in contexts]
+
+    # 全コンテキストの長さ配列を連結し、区切りオフセットを記録する
+    lengths: List[int] = []
+    offsets: List[int] = []
+    extend = lengths.extend
+    append_offset = offsets.append
+    for context in contexts:
+        append_offset(len(lengths))
+        extend(context.code_lengths())
+
+    totals = np.add.reduceat(
+        np.asarray(lengths, dtype=np.int64), offsets
+    ) // 3
+
+    estimates = totals.tolist()
+    for context, estimate in zip(contexts, estimates):
+        context._token_estimate = estimate
+    return estimates
+
+
 class TokenOptimizer:
     """トークン制限内に収まるようにコンテキストを最適化する。"""
 
@@ -89,6 +134,8 @@ class TokenOptimizer:
                 key=lambda m: len(m.definition)
             )
 
+        # 切り詰めで内容が変わっている可能性があるためキャッシュを破棄
+        context.invalidate_token_cache()
         final_tokens = context.estimate_tokens()
         logger.debug(
             f"Context optimized: {final_tokens} tokens "
@@ -2,13 +2,134 @@
 
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import json
+import functools
+import hashlib
 import logging
+import os
 import re
+import shlex
+
+import orjson
+
+# ijsonは任意依存（巨大なcompile_commands.jsonのストリーミング用）
+try:
+    import ijson
+    _JSON_DECODE_ERRORS = (ValueError, OSError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    _JSON_DECODE_ERRORS = (ValueError, OSError)
 
 logger = logging.getLogger(__name__)
 
+# 追跡対象のCMakeコマンドを1つの選択肢パターンに統合する
+# （コマンドごとにcontent全体を走査し直すのを避け、1パスで抽出する）
+_CMAKE_DIRECTIVE_RE = re.compile(
+    r"""
+    (?P<project>project\s*\(\s*(?P<project_name>\w+))
+    |(?P<cxx_std>set\s*\(\s*CMAKE_CXX_STANDARD\s+(?P<std_value>\d+)\s*\))
+    |(?P<target_include>target_include_directories\s*\(\s*\w+\s+
+        (?:PUBLIC|PRIVATE|INTERFACE)\s+(?P<target_include_list>[^)]+)\))
+    |(?P<include_dirs>include_directories\s*\((?P<include_list>[^)]+)\))
+    |(?P<subdir>add_subdirectory\s*\(\s*(?P<subdir_name>[^\s\)]+))
+    |(?P<target_defs>target_compile_definitions\s*\(\s*\w+\s+
+        (?:PUBLIC|PRIVATE|INTERFACE)\s+(?P<target_defs_list>[^)]+)\))
+    |(?P<compile_defs>add_compile_definitions\s*\((?P<defs_list>[^)]+)\))
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+# 正規表現走査前の事前フィルタに使うリテラルキーワード
+# （C実装の部分文字列検索は正規表現のミスより桁違いに安い）
+# target_include_directoriesはinclude_directoriesを含むため列挙不要
+_CMAKE_KEYWORDS = (
+    "project",
+    "cmake_cxx_standard",
+    "include_directories",
+    "add_subdirectory",
+    "add_compile_definitions",
+    "target_compile_definitions",
+)
+
+# サブディレクトリ解析用（include_directoriesのみ対象）
+_INCLUDE_DIRECTORIES_RE = re.compile(
+    r'include_directories\s*\(([^)]+)\)',
+    re.IGNORECASE,
+)
+
+# パス・定義リストの分割／変数展開用
+_WHITESPACE_RE = re.compile(r'\s+')
+_CMAKE_SOURCE_DIR_RE = re.compile(r'\$\{CMAKE_SOURCE_DIR\}')
+_CMAKE_CURRENT_SOURCE_DIR_RE = re.compile(r'\$\{CMAKE_CURRENT_SOURCE_DIR\}')
+_PROJECT_SOURCE_DIR_RE = re.compile(r'\$\{PROJECT_SOURCE_DIR\}')
+
+# Path.resolve()は全パス要素をstat()するため高コスト。
+# realpath + lru_cacheで同一パスの正規化コストを1回に抑える
+_realpath_cached = functools.lru_cache(maxsize=4096)(os.path.realpath)
+
+
+def _process_entries(entries) -> tuple:
+    """compile_commands.jsonのエントリ群から設定情報を抽出する。
+
+    逐次・ストリーミング・並列ワーカーで共用する処理本体。
+    ProcessPoolExecutorからpickle参照できるようモジュール関数にしている。
+
+    Args:
+        entries: エントリ辞書のイテラブル
+
+    Returns:
+        (include_set, source_dirs, definitions, cxx_standard) のタプル
+    """
+    include_set: set = set()
+    source_dirs: set = set()
+    definitions: set = set()
+    cxx_standard: Optional[str] = None
+
+    for entry in entries:
+        command = entry.get("command", "") or entry.get("arguments", [])
+        if isinstance(command, list):
+            args = command
+        else:
+            args = CMakeParser._tokenize_command(command)
+
+        i = 0
+        while i < len(args):
+            arg = args[i]
+            if arg.startswith("-I"):
+                # -I/path または -I /path の両方に対応
+                if len(arg) > 2:
+                    inc_path = arg[2:]
+                elif i + 1 < len(args):
+                    i += 1
+                    inc_path = args[i]
+                else:
+                    inc_path = ""
+                if inc_path:
+                    try:
+                        resolved = _realpath_cached(inc_path)
+                        if os.path.exists(resolved):
+                            include_set.add(resolved)
+                    except (OSError, ValueError):
+                        pass
+            elif arg.startswith("-D"):
+                definitions.add(arg)
+            elif arg.startswith("-std=c++"):
+                cxx_standard = arg.split("=")[1]
+            i += 1
+
+        # ソースディレクトリを収集
+        source_file = entry.get("file", "")
+        if source_file:
+            try:
+                source_path = _realpath_cached(source_file)
+                if os.path.exists(source_path):
+                    source_dirs.add(os.path.dirname(source_path))
+            except (OSError, ValueError):
+                pass
+
+    return include_set, source_dirs, definitions, cxx_standard
+
 
 @dataclass
 class CMakeConfig:
@@ -39,28 +160,56 @@ class CMakeParser:
         project_root: CMakeプロジェクトのルートディレクトリ
     """
 
+    # parse()結果のメモ化キャッシュ
+    # キー: (project_root, 入力ファイル内容のダイジェスト)
+    # touch等でmtimeだけ変わっても内容が同じならヒットし続ける
+    _CACHE: Dict[tuple, CMakeConfig] = {}
+
     def __init__(self, project_root: str):
         """Initialize CMakeParser.
 
         Args:
             project_root: CMakeプロジェクトのルートディレクトリパス
         """
+        self.set_project_root(project_root)
+
+    def set_project_root(self, project_root: str) -> None:
+        """解析対象のプロジェクトルートを差し替える。
+
+        インスタンスを使い回して別プロジェクトを解析する場合に
+        使用する。プロジェクト固有の内部状態もリセットされる。
+
+        Args:
+            project_root: 新しいプロジェクトルートのパス
+        """
         self.project_root = Path(project_root)
         self._cmake_vars: Dict[str, str] = {}
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """parse()結果のキャッシュをクリア。"""
+        cls._CACHE.clear()
+
     def parse(self) -> CMakeConfig:
         """CMakeプロジェクトを解析。
 
         compile_commands.json があれば優先使用し、
         なければ CMakeLists.txt を静的解析する。
+        結果は入力ファイル内容のハッシュ単位でメモ化され、内容が
+        変わらない限り繰り返し呼び出しでは解析処理をスキップする。
 
         Returns:
             CMakeConfig: 抽出された設定
         """
-        config = CMakeConfig()
+        compile_commands = self._find_compile_commands()
+
+        cache_key = self._cache_key(compile_commands)
+        cached = self._CACHE.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Using cached parse result for {self.project_root}")
+            return cached
 
         # 1. compile_commands.json があれば優先使用
-        compile_commands = self._find_compile_commands()
         if compile_commands:
             logger.info(f"Using compile_commands.json: {compile_commands}")
             config = self._parse_compile_commands(compile_commands)
@@ -69,8 +218,58 @@ class CMakeParser:
             logger.info("Parsing CMakeLists.txt statically")
             config = self._parse_cmake_files()
 
+        self._CACHE[cache_key] = config
         return config
 
+    def _cache_key(self, compile_commands: Optional[Path]) -> tuple:
+        """parse()キャッシュのキーを計算する。
+
+        入力ファイル内容のblake2bダイジェストをキーにすることで、
+        IDE保存などでmtimeだけ更新されても内容が同じなら再解析しない。
+        ストリーミング閾値以上のcompile_commands.jsonはハッシュ計算
+        自体が全読込になるため、mtimeで代用する。
+
+        Args:
+            compile_commands: compile_commands.json のパス（なければNone）
+
+        Returns:
+            (project_root, ダイジェスト) のタプル
+        """
+        h = hashlib.blake2b(digest_size=16)
+        try:
+            h.update((self.project_root / "CMakeLists.txt").read_bytes())
+        except OSError:
+            h.update(b"<no-cmakelists>")
+
+        if compile_commands is not None:
+            try:
+                if (
+                    compile_commands.stat().st_size
+                    >= self._STREAMING_THRESHOLD
+                ):
+                    h.update(str(self._mtime_ns(compile_commands)).encode())
+                else:
+                    h.update(compile_commands.read_bytes())
+            except OSError:
+                h.update(b"<no-compile-commands>")
+
+        return (str(self.project_root), h.digest())
+
+    @staticmethod
+    def _mtime_ns(path: Path) -> int:
+        """ファイルのmtime（ナノ秒）を取得。未存在時は-1。
+
+        Args:
+            path: 対象ファイルのパス
+
+        Returns:
+            st_mtime_ns、ファイルが存在しない場合は-1
+        """
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return -1
+
     def _find_compile_commands(self) -> Optional[Path]:
         """compile_commands.json を検索。
 
@@ -91,6 +290,38 @@ class CMakeParser:
                 return path
         return None
 
+    # このサイズ以上のcompile_commands.jsonはストリーミングでパースする
+    _STREAMING_THRESHOLD = 8 * 1024 * 1024
+
+    # このエントリ数以上ならプロセスプールで並列処理する
+    # （プール起動コストを回収できない小規模DBは逐次のまま）
+    _PARALLEL_MIN_ENTRIES = 20000
+    _PARALLEL_CHUNK_SIZE = 1024
+
+    def _iter_compile_commands(self, path: Path):
+        """compile_commands.json のエントリを順に返す。
+
+        ijsonが利用可能でファイルが閾値を超える場合は、全体を
+        メモリに載せずエントリ単位でストリーミングする。それ以外は
+        orjsonで一括パースする。
+
+        Args:
+            path: compile_commands.json のパス
+
+        Yields:
+            エントリの辞書
+        """
+        if (
+            ijson is not None
+            and path.stat().st_size >= self._STREAMING_THRESHOLD
+        ):
+            logger.debug(f"Streaming large compile_commands.json: {path}")
+            with open(path, "rb") as f:
+                yield from ijson.items(f, "item")
+            return
+
+        yield from orjson.loads(path.read_bytes())
+
     def _parse_compile_commands(self, path: Path) -> CMakeConfig:
         """compile_commands.json をパース。
 
@@ -101,59 +332,25 @@ class CMakeParser:
             CMakeConfig: 抽出された設定
         """
         config = CMakeConfig()
-        include_set: set[str] = set()
-        source_dirs: set[str] = set()
-        definitions: set[str] = set()
-        cxx_standard: Optional[str] = None
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            if (
+                ijson is not None
+                and path.stat().st_size >= self._STREAMING_THRESHOLD
+            ):
+                # 巨大ファイルはメモリ抑制を優先して逐次ストリーミング
+                parts = _process_entries(self._iter_compile_commands(path))
+            else:
+                entries = orjson.loads(path.read_bytes())
+                if len(entries) >= self._PARALLEL_MIN_ENTRIES:
+                    parts = self._process_entries_parallel(entries)
+                else:
+                    parts = _process_entries(entries)
+        except _JSON_DECODE_ERRORS as e:
             logger.error(f"Failed to parse compile_commands.json: {e}")
-            return config
+            return CMakeConfig()
 
-        for entry in data:
-            command = entry.get("command", "") or entry.get("arguments", [])
-            if isinstance(command, list):
-                args = command
-            else:
-                args = command.split()
-
-            i = 0
-            while i < len(args):
-                arg = args[i]
-                if arg.startswith("-I"):
-                    # -I/path または -I /path の両方に対応
-                    if len(arg) > 2:
-                        inc_path = arg[2:]
-                    elif i + 1 < len(args):
-                        i += 1
-                        inc_path = args[i]
-                    else:
-                        inc_path = ""
-                    if inc_path:
-                        try:
-                            resolved = Path(inc_path).resolve()
-                            if resolved.exists():
-                                include_set.add(str(resolved))
-                        except (OSError, ValueError):
-                            pass
-                elif arg.startswith("-D"):
-                    definitions.add(arg)
-                elif arg.startswith("-std=c++"):
-                    cxx_standard = arg.split("=")[1]
-                i += 1
-
-            # ソースディレクトリを収集
-            source_file = entry.get("file", "")
-            if source_file:
-                try:
-                    source_path = Path(source_file).resolve()
-                    if source_path.exists():
-                        source_dirs.add(str(source_path.parent))
-                except (OSError, ValueError):
-                    pass
+        include_set, source_dirs, definitions, cxx_standard = parts
 
         config.include_paths = sorted(include_set)
         config.source_directories = sorted(source_dirs)
@@ -172,6 +369,61 @@ class CMakeParser:
 
         return config
 
+    def _process_entries_parallel(self, entries: list) -> tuple:
+        """エントリ群をチャンク分割してプロセスプールで処理する。
+
+        エントリごとの処理（トークン分割・パス正規化・重複排除）は
+        互いに独立なため、チャンク単位でワーカーに分配し、結果の
+        集合を親プロセスでマージする。
+
+        Args:
+            entries: エントリ辞書のリスト
+
+        Returns:
+            (include_set, source_dirs, definitions, cxx_standard) のタプル
+        """
+        include_set: set = set()
+        source_dirs: set = set()
+        definitions: set = set()
+        cxx_standard: Optional[str] = None
+
+        chunk_size = self._PARALLEL_CHUNK_SIZE
+        chunks = [
+            entries[i:i + chunk_size]
+            for i in range(0, len(entries), chunk_size)
+        ]
+        logger.debug(
+            f"Processing {len(entries)} entries in {len(chunks)} "
+            f"parallel chunks"
+        )
+        with ProcessPoolExecutor() as executor:
+            for inc, dirs, defs, std in executor.map(_process_entries, chunks):
+                include_set |= inc
+                source_dirs |= dirs
+                definitions |= defs
+                if std:
+                    cxx_standard = std
+
+        return include_set, source_dirs, definitions, cxx_standard
+
+    @staticmethod
+    def _tokenize_command(command: str) -> List[str]:
+        """コンパイルコマンド文字列をトークン列に分割する。
+
+        引用符・エスケープを含まない大多数のエントリはC実装の
+        str.split()で分割し、含む場合のみ純Pythonのshlex.splitに
+        フォールバックする。スペースを含むパスも正しく扱える。
+
+        Args:
+            command: compile_commands.jsonのcommand文字列
+
+        Returns:
+            トークンのリスト
+        """
+        if '"' not in command and "'" not in command and "\\" not in command:
+            return command.split()
+        return shlex.split(command)
+
     def _parse_cmake_files(self) -> CMakeConfig:
         """CMakeLists.txt を静的解析。
 
@@ -186,92 +438,48 @@ class CMakeParser:
             return config
 
         try:
-            content = cmake_file.read_text(encoding="utf-8", errors="ignore")
+            content = self._read_text_fast(cmake_file)
         except IOError as e:
             logger.error(f"Failed to read CMakeLists.txt: {e}")
             return config
 
-        # project() からプロジェクト名を抽出
-        project_match = re.search(r'project\s*\(\s*(\w+)', content, re.IGNORECASE)
-        if project_match:
-            config.project_name = project_match.group(1)
-            logger.debug(f"Found project name: {config.project_name}")
-
-        # CMAKE_CXX_STANDARD を抽出
-        std_match = re.search(
-            r'set\s*\(\s*CMAKE_CXX_STANDARD\s+(\d+)\s*\)',
-            content,
-            re.IGNORECASE
-        )
-        if std_match:
-            config.cxx_standard = f"c++{std_match.group(1)}"
-            config.compiler_args.append(f"-std=c++{std_match.group(1)}")
-            logger.debug(f"Found C++ standard: {config.cxx_standard}")
-
-        # include_directories() を抽出
-        for match in re.finditer(
-            r'include_directories\s*\(([^)]+)\)',
-            content,
-            re.IGNORECASE
-        ):
-            dirs = self._parse_path_list(match.group(1))
-            config.include_paths.extend(dirs)
-
-        # target_include_directories() を抽出
-        # 形式: target_include_directories(target PUBLIC|PRIVATE|INTERFACE dir1 dir2 ...)
-        for match in re.finditer(
-            r'target_include_directories\s*\(\s*\w+\s+(PUBLIC|PRIVATE|INTERFACE)\s+([^)]+)\)',
-            content,
-            re.IGNORECASE
-        ):
-            dirs = self._parse_path_list(match.group(2))
-            config.include_paths.extend(dirs)
-
-        # add_subdirectory() を抽出
-        for match in re.finditer(
-            r'add_subdirectory\s*\(\s*([^\s\)]+)',
-            content,
-            re.IGNORECASE
-        ):
-            subdir = match.group(1).strip('"\'')
-            subdir_path = self.project_root / subdir
-            if subdir_path.exists() and subdir_path.is_dir():
-                config.source_directories.append(str(subdir_path.resolve()))
-                logger.debug(f"Found subdirectory: {subdir_path}")
-
-        # add_compile_definitions() を抽出
-        for match in re.finditer(
-            r'add_compile_definitions\s*\(([^)]+)\)',
-            content,
-            re.IGNORECASE
-        ):
-            defs = self._parse_definition_list(match.group(1))
-            config.compiler_args.extend(defs)
-
-        # target_compile_definitions() を抽出
-        for match in re.finditer(
-            r'target_compile_definitions\s*\(\s*\w+\s+(PUBLIC|PRIVATE|INTERFACE)\s+([^)]+)\)',
-            content,
-            re.IGNORECASE
-        ):
-            defs = self._parse_definition_list(match.group(2))
-            config.compiler_args.extend(defs)
+        # 収集中の重複排除用アキュムレータ（dictで挿入順を保持）
+        # リストへのextend + 最後のdict.fromkeysと違い、重複が
+        # 中間リストを膨らませず挿入ごとO(1)で弾かれる
+        include_acc: Dict[str, None] = {}
+        source_acc: Dict[str, None] = {}
+        args_acc: Dict[str, None] = {}
+
+        # 追跡対象キーワードを1つも含まないファイルは正規表現走査をスキップ
+        if self._has_cmake_keywords(content):
+            self._apply_cmake_directives(
+                content, config, include_acc, source_acc, args_acc
+            )
 
         # サブディレクトリの CMakeLists.txt も解析
-        self._parse_subdirectory_cmake_files(config)
+        self._parse_subdirectory_cmake_files(source_acc, include_acc)
 
         # ソースディレクトリがない場合は一般的なディレクトリを探す
-        if not config.source_directories:
-            for common_dir in ["src", "source", "lib"]:
-                src_dir = self.project_root / common_dir
-                if src_dir.exists() and src_dir.is_dir():
-                    config.source_directories.append(str(src_dir.resolve()))
+        # 候補ごとのexists+is_dir（2 stat）ではなく、1回のscandirで
+        # ディレクトリ種別込みのエントリを列挙する
+        if not source_acc:
+            found: Dict[str, str] = {}
+            try:
+                with os.scandir(self.project_root) as entries:
+                    for entry in entries:
+                        if entry.name in ("src", "source", "lib") \
+                                and entry.is_dir():
+                            found[entry.name] = entry.path
+            except OSError as e:
+                logger.warning(f"Failed to scan {self.project_root}: {e}")
+            for common_dir in ("src", "source", "lib"):
+                if common_dir in found:
+                    source_acc[_realpath_cached(found[common_dir])] = None
                     break
 
-        # 重複を除去
-        config.include_paths = list(dict.fromkeys(config.include_paths))
-        config.source_directories = list(dict.fromkeys(config.source_directories))
-        config.compiler_args = list(dict.fromkeys(config.compiler_args))
+        config.include_paths = list(include_acc)
+        config.source_directories = list(source_acc)
+        config.compiler_args = list(args_acc)
 
         logger.info(
             f"Extracted from CMakeLists.txt: "
@@ -282,29 +490,118 @@ class CMakeParser:
 
         return config
 
-    def _parse_subdirectory_cmake_files(self, config: CMakeConfig) -> None:
+    @staticmethod
+    def _read_text_fast(path: Path) -> str:
+        """ファイルを一括読み込みしてUTF-8文字列として返す。
+
+        read_text()のテキストIOレイヤ（逐次デコード・改行変換）を
+        経由せず、バイト列を1回のread + 1回のdecodeで処理する。
+        正規表現走査は改行コードに依存しないため\\r\\nのままで問題ない。
+
+        Args:
+            path: 読み込むファイルのパス
+
+        Returns:
+            ファイル内容の文字列
+        """
+        return path.read_bytes().decode("utf-8", errors="ignore")
+
+    @staticmethod
+    def _has_cmake_keywords(content: str) -> bool:
+        """追跡対象のCMakeコマンド名が含まれるかを確認する。
+
+        C実装の部分文字列検索による事前フィルタ。キーワードを
+        含まないファイルでは統合正規表現の走査を丸ごと省略できる。
+
+        Args:
+            content: CMakeLists.txtの内容
+
+        Returns:
+            キーワードを1つでも含む場合True
+        """
+        content_lower = content.lower()
+        for keyword in _CMAKE_KEYWORDS:
+            if keyword in content_lower:
+                return True
+        return False
+
+    def _apply_cmake_directives(
+        self,
+        content: str,
+        config: CMakeConfig,
+        include_acc: Dict[str, None],
+        source_acc: Dict[str, None],
+        args_acc: Dict[str, None],
+    ) -> None:
+        """統合パターンの1パスでCMakeコマンドを抽出して反映する。
+
+        lastgroupはマッチした選択肢の外側グループ名を返すため、
+        グループごとのgroup()呼び出しを重ねずに1回の属性参照で
+        ディスパッチできる。各選択肢の内側グループは外側の直後に
+        定義されているので、値はlastindex+1で取り出せる。
+
+        Args:
+            content: CMakeLists.txtの内容
+            config: スカラー設定を反映する CMakeConfig オブジェクト
+            include_acc: インクルードパスのアキュムレータ
+            source_acc: ソースディレクトリのアキュムレータ
+            args_acc: コンパイラ引数のアキュムレータ
+        """
+        for match in _CMAKE_DIRECTIVE_RE.finditer(content):
+            kind = match.lastgroup
+            value = match.group(match.lastindex + 1)
+            if kind == "project":
+                # 最初のproject()のみ採用
+                if config.project_name is None:
+                    config.project_name = value
+                    logger.debug(f"Found project name: {config.project_name}")
+            elif kind == "cxx_std":
+                # 最初のCMAKE_CXX_STANDARDのみ採用
+                if config.cxx_standard is None:
+                    config.cxx_standard = f"c++{value}"
+                    args_acc[f"-std=c++{value}"] = None
+                    logger.debug(f"Found C++ standard: {config.cxx_standard}")
+            elif kind in ("target_include", "include_dirs"):
+                for path in self._parse_path_list(value):
+                    include_acc[path] = None
+            elif kind == "subdir":
+                subdir_path = self.project_root / value.strip('"\'')
+                if subdir_path.exists() and subdir_path.is_dir():
+                    source_acc[_realpath_cached(str(subdir_path))] = None
+                    logger.debug(f"Found subdirectory: {subdir_path}")
+            elif kind in ("target_defs", "compile_defs"):
+                for definition in self._parse_definition_list(value):
+                    args_acc[definition] = None
+
+    def _parse_subdirectory_cmake_files(
+        self,
+        source_acc: Dict[str, None],
+        include_acc: Dict[str, None],
+    ) -> None:
         """サブディレクトリの CMakeLists.txt を解析。
 
         Args:
-            config: 設定を追加する CMakeConfig オブジェクト
+            source_acc: ソースディレクトリのアキュムレータ
+            include_acc: インクルードパスのアキュムレータ
         """
-        for subdir in config.source_directories.copy():
+        for subdir in list(source_acc):
             subdir_cmake = Path(subdir) / "CMakeLists.txt"
             if subdir_cmake.exists():
                 try:
-                    content = subdir_cmake.read_text(encoding="utf-8", errors="ignore")
+                    content = self._read_text_fast(subdir_cmake)
+
+                    # 事前フィルタ: コマンド名を含まないファイルは走査不要
+                    if "include_directories" not in content.lower():
+                        continue
 
                     # include_directories() を抽出
-                    for match in re.finditer(
-                        r'include_directories\s*\(([^)]+)\)',
-                        content,
-                        re.IGNORECASE
-                    ):
+                    for match in _INCLUDE_DIRECTORIES_RE.finditer(content):
                         dirs = self._parse_path_list(
                             match.group(1),
                             base_dir=Path(subdir)
                         )
-                        config.include_paths.extend(dirs)
+                        for path in dirs:
+                            include_acc[path] = None
 
                 except IOError as e:
                     logger.warning(f"Failed to read {subdir_cmake}: {e}")
@@ -327,11 +624,11 @@ class CMakeParser:
         base = base_dir or self.project_root
 
         # 変数展開
-        text = re.sub(r'\$\{CMAKE_SOURCE_DIR\}', str(self.project_root), text)
-        text = re.sub(r'\$\{CMAKE_CURRENT_SOURCE_DIR\}', str(base), text)
-        text = re.sub(r'\$\{PROJECT_SOURCE_DIR\}', str(self.project_root), text)
+        text = _CMAKE_SOURCE_DIR_RE.sub(str(self.project_root), text)
+        text = _CMAKE_CURRENT_SOURCE_DIR_RE.sub(str(base), text)
+        text = _PROJECT_SOURCE_DIR_RE.sub(str(self.project_root), text)
 
-        for item in re.split(r'\s+', text.strip()):
+        for item in _WHITESPACE_RE.split(text.strip()):
             item = item.strip('"\'')
             # 未展開の変数やキーワードをスキップ
             if not item or item.startswith('$') or item in ('PUBLIC', 'PRIVATE', 'INTERFACE'):
@@ -341,9 +638,9 @@ class CMakeParser:
                 path = Path(item)
                 if not path.is_absolute():
                     path = base / path
-                resolved = path.resolve()
-                if resolved.exists() and resolved.is_dir():
-                    paths.append(str(resolved))
+                resolved = _realpath_cached(str(path))
+                if os.path.isdir(resolved):
+                    paths.append(resolved)
             except (OSError, ValueError) as e:
                 logger.debug(f"Failed to resolve path {item}: {e}")
 
@@ -360,7 +657,7 @@ class CMakeParser:
         """
         defs: List[str] = []
 
-        for item in re.split(r'\s+', text.strip()):
+        for item in _WHITESPACE_RE.split(text.strip()):
             item = item.strip('"\'')
             # 未展開の変数やキーワードをスキップ
             if not item or item.startswith('$') or item in ('PUBLIC', 'PRIVATE', 'INTERFACE'):
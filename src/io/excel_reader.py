@@ -55,13 +55,21 @@ class ExcelReader:
         self._load_dataframe()
         self._resolve_column_names()
 
-        findings = []
-        for idx, row in self._df.iterrows():
-            try:
-                finding = self._row_to_finding(row, idx)
-                findings.append(finding)
-            except Exception as e:
-                logger.warning(f"Failed to parse row {idx}: {e}")
+        try:
+            # 列単位の一括変換（行ごとのiterrows/Seriesアクセスを回避）
+            findings = Finding.from_dataframe(self._df, self._column_map)
+        except Exception as e:
+            # 不正な行が混在する場合は従来の行単位パースで読めるだけ読む
+            logger.warning(
+                f"Vectorized read failed ({e}), "
+                f"falling back to row-by-row parsing"
+            )
+            findings = []
+            for idx, row in self._df.iterrows():
+                try:
+                    findings.append(self._row_to_finding(row, idx))
+                except Exception as row_error:
+                    logger.warning(f"Failed to parse row {idx}: {row_error}")
 
         logger.info(f"Loaded {len(findings)} findings from {self.file_path}")
         return findings
@@ -1,6 +1,6 @@
 """分類結果のExcel出力モジュール。"""
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 from pathlib import Path
 import shutil
 import logging
@@ -44,45 +44,91 @@ class ExcelWriter:
         self.output_file = Path(output_file)
         self.sheet_name = sheet_name
 
+        # ストリーミング書き込み用の状態
+        self._wb = None
+        self._ws = None
+        self._last_col: int = 0
+
+    def open(self) -> None:
+        """ストリーミング書き込みを開始する。
+
+        入力ファイルを出力先にコピーしてワークブックを開き、
+        結果列のヘッダーを追加する。以降はwrite_result()で
+        1件ずつ書き込み、checkpoint()/close()で保存する。
+        """
+        shutil.copy(self.input_file, self.output_file)
+
+        self._wb = load_workbook(self.output_file)
+        self._ws = (
+            self._wb.active if self.sheet_name is None
+            else self._wb[self.sheet_name]
+        )
+        self._last_col = self._ws.max_column
+
+        self._add_headers(self._ws, self._last_col)
+
+    def write_result(
+        self,
+        result: ClassificationResult,
+        row_num: int
+    ) -> None:
+        """1件の分類結果をワークシートに書き込む。
+
+        結果を保持せずその場で書き込むため、メモリ使用量は
+        指摘件数に依存しない。
+
+        Args:
+            result: 書き込む分類結果
+            row_num: 書き込むExcel行番号
+        """
+        if self._ws is None:
+            raise RuntimeError("ExcelWriter.open() has not been called")
+
+        self._write_result_row(self._ws, row_num, self._last_col, result)
+
+    def checkpoint(self) -> None:
+        """現在までの結果をファイルに保存する（途中クラッシュ対策）。"""
+        if self._wb is None:
+            return
+        self._wb.save(self.output_file)
+        logger.debug(f"Checkpoint saved: {self.output_file}")
+
+    def close(self) -> None:
+        """列幅を調整してワークブックを保存し、書き込みを終了する。"""
+        if self._wb is None:
+            return
+
+        self._adjust_column_widths(self._ws, self._last_col)
+        self._wb.save(self.output_file)
+
+        self._wb = None
+        self._ws = None
+
+        logger.info(f"Results written to {self.output_file}")
+
     def write_results(
         self,
         results: Dict[str, ClassificationResult],
         finding_id_to_row: Dict[str, int]
     ) -> None:
-        """分類結果をExcelファイルに書き込む。
+        """分類結果をまとめてExcelファイルに書き込む。
+
+        一括書き込み用の従来API。内部ではストリーミング書き込みを使用する。
 
         Args:
             results: 指摘IDから分類結果へのマッピング
             finding_id_to_row: 指摘IDからExcel行番号へのマッピング
         """
-        # 入力ファイルを出力先にコピー
-        shutil.copy(self.input_file, self.output_file)
-
-        # ワークブックを開く
-        wb = load_workbook(self.output_file)
-        ws = wb.active if self.sheet_name is None else wb[self.sheet_name]
-
-        # 最終列を取得
-        last_col = ws.max_column
-
-        # 結果列のヘッダーを追加
-        self._add_headers(ws, last_col)
+        self.open()
 
-        # 各指摘の結果を書き込む
         for finding_id, result in results.items():
             if finding_id not in finding_id_to_row:
                 logger.warning(f"Finding {finding_id} not found in row mapping")
                 continue
 
-            row_num = finding_id_to_row[finding_id]
-            self._write_result_row(ws, row_num, last_col, result)
+            self.write_result(result, finding_id_to_row[finding_id])
 
-        # 列幅を調整
-        self._adjust_column_widths(ws, last_col)
-
-        # ワークブックを保存
-        wb.save(self.output_file)
-        logger.info(f"Results written to {self.output_file}")
+        self.close()
 
     def _add_headers(self, ws, last_col: int) -> None:
         """結果列のヘッダーを追加する。
@@ -184,6 +230,26 @@ class ExcelWriter:
         Args:
             results: 全分類結果のリスト
         """
+        counts: Dict[ClassificationType, int] = {}
+        for result in results:
+            counts[result.classification] = counts.get(result.classification, 0) + 1
+
+        self.write_summary_counts(counts, len(results))
+
+    def write_summary_counts(
+        self,
+        counts: Dict[ClassificationType, int],
+        total: int
+    ) -> None:
+        """集計済みカウントからサマリーシートを追加する。
+
+        結果リスト全体を保持せず、分類ごとのカウンターだけで
+        サマリーを書き込めるようにする。
+
+        Args:
+            counts: 分類タイプから件数へのマッピング
+            total: 指摘の総数
+        """
         wb = load_workbook(self.output_file)
 
         # 既存のSummaryシートがあれば削除
@@ -193,18 +259,18 @@ class ExcelWriter:
         # 新しいSummaryシートを作成
         ws = wb.create_sheet("Summary")
 
-        # 統計を計算
-        total = len(results)
-        counts: Dict[ClassificationType, int] = {
-            ClassificationType.FALSE_POSITIVE: 0,
-            ClassificationType.DEVIATION: 0,
-            ClassificationType.FIX_REQUIRED: 0,
-            ClassificationType.UNDETERMINED: 0,
+        # 全分類タイプを順序固定で集計
+        counts = {
+            ClassificationType.FALSE_POSITIVE: counts.get(
+                ClassificationType.FALSE_POSITIVE, 0),
+            ClassificationType.DEVIATION: counts.get(
+                ClassificationType.DEVIATION, 0),
+            ClassificationType.FIX_REQUIRED: counts.get(
+                ClassificationType.FIX_REQUIRED, 0),
+            ClassificationType.UNDETERMINED: counts.get(
+                ClassificationType.UNDETERMINED, 0),
         }
 
-        for result in results:
-            counts[result.classification] += 1
-
         # タイトルを書き込む
         ws["A1"] = "分類結果サマリー"
         ws["A1"].font = Font(bold=True, size=14)
@@ -283,7 +349,3 @@ class ExcelWriter:
 
         wb.save(self.output_file)
         logger.info(f"Summary sheet added to {self.output_file}")
-
-
-# 不足しているインポートを追加
-from typing import Optional
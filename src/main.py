@@ -1,9 +1,10 @@
 """静的解析自動分類ツールのメインエントリーポイント。"""
 
 import argparse
+import collections
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import logging
 
@@ -12,13 +13,20 @@ from .io.excel_reader import ExcelReader
 from .io.excel_writer import ExcelWriter
 from .io.rules_loader import RulesLoader
 from .analyzer.clang_analyzer import ClangAnalyzer
+from .analyzer.ast_prewarm import prewarm_ast_cache
 from .context.context_builder import ContextBuilder
 from .context.token_optimizer import TokenOptimizer
-from .classifier.llm_client import LLMClient, LLMConfig, LLMError
+from .classifier.llm_client import (
+    BatchClassificationResponse,
+    LLMClient,
+    LLMConfig,
+    LLMError,
+)
 from .classifier.prompt_builder import PromptBuilder
 from .classifier.response_parser import ResponseParser
 from .models.finding import Finding
 from .models.classification import ClassificationResult
+from .models.context import AnalysisContext
 from .utils.logger import setup_logging, ProgressLogger
 
 logger = logging.getLogger(__name__)
@@ -37,6 +45,9 @@ class ProcessingStats:
 class StaticAnalysisClassifier:
     """静的解析自動分類のメインクラス。"""
 
+    # ストリーミング書き込みの途中保存間隔（件数）
+    CHECKPOINT_INTERVAL = 50
+
     def __init__(self, config: Config):
         """分類器を初期化する。
 
@@ -95,6 +106,19 @@ class StaticAnalysisClassifier:
         # レスポンスパーサー
         self.response_parser = ResponseParser()
 
+        # Phase 2に進む可能性が高いルール（正規化して保持）
+        self._phase2_likely_rules = set()
+        for rule_id in self.config.phase2_likely_rules:
+            self._phase2_likely_rules.add(rule_id)
+            self._phase2_likely_rules.add(
+                self.prompt_builder._normalize_rule_id(rule_id)
+            )
+
+        # ホットループで参照する設定値を実行開始時に固定する
+        # （ループ内の属性チェーン参照を避ける）
+        self._confidence_threshold = self.config.confidence_threshold
+        self._batch_size = max(1, self.config.batch_size)
+
         logger.info("All components initialized")
 
     def process(
@@ -119,39 +143,62 @@ class StaticAnalysisClassifier:
 
         logger.info(f"Loaded {self.stats.total} findings")
 
-        # 指摘IDから行番号へのマッピングを作成
-        finding_id_to_row: Dict[str, int] = {
-            f.id: i + 2  # ヘッダー行と1始まりインデックスのため+2
-            for i, f in enumerate(findings)
-        }
-
-        # 指摘を処理
-        results: Dict[str, ClassificationResult] = {}
-        progress = ProgressLogger(self.stats.total, logger, log_interval=10)
-
-        for finding in findings:
-            try:
-                result = self._classify_finding(finding)
-                results[finding.id] = result
-
-                if result.phase == 1:
-                    self.stats.phase1_resolved += 1
-                else:
-                    self.stats.phase2_resolved += 1
+        # 指摘対象ファイルのASTを並列に事前解析
+        files = {f.location.file_path for f in findings}
+        ast_cache = prewarm_ast_cache(
+            files,
+            self.config.include_paths,
+            self.config.compiler_args
+        )
+        self.context_builder.set_ast_cache(ast_cache)
 
-            except Exception as e:
-                logger.error(f"Error processing {finding.id}: {e}")
-                results[finding.id] = self.response_parser.create_error_result(
-                    finding.id, str(e), 0
-                )
-                self.stats.errors += 1
+        # 結果は保持せず、生成され次第Excelへストリーミング書き込みする
+        writer = ExcelWriter(input_file, output_file, sheet_name)
+        writer.open()
 
-            progress.update(finding.id)
+        classification_counts: collections.Counter = collections.Counter()
+        processed = 0
+        progress = ProgressLogger(self.stats.total, logger, log_interval=10)
 
-        # 結果をExcelに書き込み
-        writer = ExcelWriter(input_file, output_file, sheet_name)
-        writer.write_results(results, finding_id_to_row)
-        writer.write_summary(list(results.values()))
+        # 同一ルールの指摘をまとめ、共通のルール説明・指示を償却する
+        # 行番号は読み込み順から位置的に決まるため、ID→行番号の辞書は不要
+        # （ヘッダー行と1始まりインデックスのため+2）
+        groups: Dict[str, List[Tuple[int, Finding]]] = collections.defaultdict(list)
+        for index, finding in enumerate(findings):
+            groups[finding.rule_id].append((index + 2, finding))
+
+        # ループ内で毎回属性解決しないようローカルに束縛する
+        batch_size = self._batch_size
+        classify_chunk = self._classify_chunk
+        write_result = writer.write_result
+        update_progress = progress.update
+        stats = self.stats
+        checkpoint_interval = self.CHECKPOINT_INTERVAL
+
+        for rule_id, group in groups.items():
+            for start in range(0, len(group), batch_size):
+                chunk_rows = group[start:start + batch_size]
+                chunk = [finding for _, finding in chunk_rows]
+                chunk_results = classify_chunk(chunk)
+
+                for row_num, finding in chunk_rows:
+                    result = chunk_results[finding.id]
+                    write_result(result, row_num)
+                    classification_counts[result.classification] += 1
+
+                    if result.phase == 1:
+                        stats.phase1_resolved += 1
+                    elif result.phase >= 2:
+                        stats.phase2_resolved += 1
+
+                    processed += 1
+                    if processed % checkpoint_interval == 0:
+                        writer.checkpoint()
+
+                    update_progress(finding.id)
+
+        writer.close()
+        writer.write_summary_counts(dict(classification_counts), processed)
 
         # 統計をログ出力
         self._log_statistics()
@@ -168,6 +215,10 @@ class StaticAnalysisClassifier:
         """
         logger.debug(f"Classifying {finding.id}: {finding.rule_id}")
 
+        # Phase 2が濃厚なルールは融合呼び出しで1往復に短縮
+        if self._is_phase2_likely(finding):
+            return self._classify_finding_fused(finding)
+
         # Phase 1: 軽量分類
         phase1_context = self.context_builder.build_phase1_context(finding)
 
@@ -203,16 +254,33 @@ class StaticAnalysisClassifier:
         result = self.response_parser.parse(response, finding.id, phase=1)
 
         # Phase 1で十分かを確認
-        if result.is_high_confidence(self.config.confidence_threshold):
+        if result.is_high_confidence(self._confidence_threshold):
             logger.debug(
                 f"  Phase 1 resolved: {result.classification.value} "
                 f"({result.confidence:.0%})"
             )
             return result
 
-        # Phase 2: 追加コンテキスト
+        return self._run_phase2(finding, phase1_context, result)
+
+    def _run_phase2(
+        self,
+        finding: Finding,
+        phase1_context,
+        phase1_result: ClassificationResult
+    ) -> ClassificationResult:
+        """追加コンテキスト付きのPhase 2分類を実行する。
+
+        Args:
+            finding: 分類する指摘
+            phase1_context: Phase 1で構築したコンテキスト
+            phase1_result: Phase 1の分類結果（Phase 2失敗時のフォールバック）
+
+        Returns:
+            分類結果
+        """
         logger.debug(
-            f"  Phase 1 confidence low ({result.confidence:.0%}), "
+            f"  Phase 1 confidence low ({phase1_result.confidence:.0%}), "
             "proceeding to Phase 2"
         )
 
@@ -222,6 +290,7 @@ class StaticAnalysisClassifier:
         optimized_context2 = self.token_optimizer.optimize_context(phase2_context)
 
         # Phase 2プロンプトを構築
+        system_prompt = self.prompt_builder.build_system_prompt()
         user_prompt2 = self.prompt_builder.build_phase2_prompt(
             finding, optimized_context2
         )
@@ -229,14 +298,14 @@ class StaticAnalysisClassifier:
         # 再度LLMを呼び出し
         try:
             response2 = self.llm_client.classify(system_prompt, user_prompt2)
-        except LLMError as e:
+        except LLMError:
             # Phase 2失敗時はPhase 1結果を返す
-            result.phase = 2
-            return result
+            phase1_result.phase = 2
+            return phase1_result
 
         if response2 is None:
-            result.phase = 2
-            return result
+            phase1_result.phase = 2
+            return phase1_result
 
         result2 = self.response_parser.parse(response2, finding.id, phase=2)
 
@@ -247,6 +316,223 @@ class StaticAnalysisClassifier:
 
         return result2
 
+    def _classify_finding_safe(self, finding: Finding) -> ClassificationResult:
+        """例外をエラー結果に変換しつつ単一の指摘を分類する。
+
+        Args:
+            finding: 分類する指摘
+
+        Returns:
+            分類結果（例外発生時はエラー結果）
+        """
+        try:
+            return self._classify_finding(finding)
+        except Exception as e:
+            logger.error(f"Error processing {finding.id}: {e}")
+            self.stats.errors += 1
+            return self.response_parser.create_error_result(
+                finding.id, str(e), 0
+            )
+
+    def _classify_chunk(
+        self,
+        chunk: List[Finding]
+    ) -> Dict[str, ClassificationResult]:
+        """同一ルールの指摘チャンクを分類する。
+
+        2件以上のチャンクは1回のバッチ呼び出しで判定し、
+        共通のルール説明・システム指示のトークンを償却する。
+        低確信度の指摘は個別にPhase 2へエスカレーションする。
+
+        Args:
+            chunk: 同一ルールIDの指摘リスト
+
+        Returns:
+            指摘IDから分類結果への辞書
+        """
+        # 単件またはPhase 2濃厚ルールは従来の個別処理
+        if len(chunk) == 1 or self._is_phase2_likely(chunk[0]):
+            return {f.id: self._classify_finding_safe(f) for f in chunk}
+
+        results: Dict[str, ClassificationResult] = {}
+        contexts = {}
+        batch_findings: List[Finding] = []
+
+        for finding in chunk:
+            context = self.context_builder.build_phase1_context(finding)
+            if context is None:
+                results[finding.id] = self.response_parser.create_skip_result(
+                    finding.id, "コンテキスト抽出失敗", 1
+                )
+                continue
+            contexts[finding.id] = self.token_optimizer.optimize_context(context)
+            batch_findings.append(finding)
+
+        if not batch_findings:
+            return results
+
+        # optimize_contextは個々のコンテキストの上限しか保証しないため、
+        # 連結後のプロンプトが入力上限を超えないよう合計トークンで分割する
+        token_budget = (
+            self.token_optimizer.max_tokens - self.token_optimizer.BASE_TOKENS
+        )
+        sub_batch: List[Finding] = []
+        sub_total = 0
+        for finding in batch_findings:
+            tokens = contexts[finding.id].estimate_tokens()
+            if sub_batch and sub_total + tokens > token_budget:
+                logger.debug(
+                    f"Splitting batch at {len(sub_batch)} findings "
+                    f"({sub_total} tokens)"
+                )
+                results.update(self._classify_batch(sub_batch, contexts))
+                sub_batch = []
+                sub_total = 0
+            sub_batch.append(finding)
+            sub_total += tokens
+        if sub_batch:
+            results.update(self._classify_batch(sub_batch, contexts))
+
+        return results
+
+    def _classify_batch(
+        self,
+        batch_findings: List[Finding],
+        contexts: Dict[str, AnalysisContext]
+    ) -> Dict[str, ClassificationResult]:
+        """構築済みコンテキストの指摘群を1回のバッチ呼び出しで分類する。
+
+        呼び出し側でバッチ合計がトークン上限内に収まっていることが前提。
+
+        Args:
+            batch_findings: 分類する指摘リスト
+            contexts: 指摘IDから最適化済みコンテキストへの辞書
+
+        Returns:
+            指摘IDから分類結果への辞書
+        """
+        # 分割の結果1件になった場合はバッチ化の利得がないため個別処理
+        if len(batch_findings) == 1:
+            finding = batch_findings[0]
+            return {finding.id: self._classify_finding_safe(finding)}
+
+        results: Dict[str, ClassificationResult] = {}
+
+        system_prompt = self.prompt_builder.build_system_prompt()
+        user_prompt = self.prompt_builder.build_batched_phase1_prompt(
+            batch_findings, contexts
+        )
+
+        try:
+            response = self.llm_client.classify(
+                system_prompt,
+                user_prompt,
+                response_model=BatchClassificationResponse
+            )
+        except LLMError as e:
+            logger.warning(
+                f"Batch call failed ({e}), falling back to individual calls"
+            )
+            response = None
+
+        if response is None:
+            for finding in batch_findings:
+                results[finding.id] = self._classify_finding_safe(finding)
+            return results
+
+        parsed = self.response_parser.parse_batch(response, phase=1)
+
+        for finding in batch_findings:
+            result = parsed.get(finding.id)
+
+            if result is None:
+                # 応答に含まれなかった指摘は個別に再分類
+                logger.warning(
+                    f"Finding {finding.id} missing from batch response"
+                )
+                results[finding.id] = self._classify_finding_safe(finding)
+                continue
+
+            if result.is_high_confidence(self._confidence_threshold):
+                results[finding.id] = result
+            else:
+                results[finding.id] = self._run_phase2(
+                    finding, contexts[finding.id], result
+                )
+
+        return results
+
+    def _is_phase2_likely(self, finding: Finding) -> bool:
+        """Phase 2へのエスカレーションが濃厚な指摘かを判定する。
+
+        Args:
+            finding: 判定する指摘
+
+        Returns:
+            融合呼び出しを使用すべき場合True
+        """
+        if not self._phase2_likely_rules:
+            return False
+
+        return (
+            finding.rule_id in self._phase2_likely_rules or
+            self.prompt_builder._normalize_rule_id(finding.rule_id)
+            in self._phase2_likely_rules
+        )
+
+    def _classify_finding_fused(self, finding: Finding) -> ClassificationResult:
+        """Phase 1/2を融合した1回のLLM呼び出しで指摘を分類する。
+
+        Phase 2コンテキストを最初から付与し、システムプロンプトの
+        自己エスカレーション指示で2回目の往復を省略する。
+
+        Args:
+            finding: 分類する指摘
+
+        Returns:
+            分類結果
+        """
+        phase1_context = self.context_builder.build_phase1_context(finding)
+
+        if phase1_context is None:
+            return self.response_parser.create_skip_result(
+                finding.id,
+                "コンテキスト抽出失敗",
+                1
+            )
+
+        phase2_context = self.context_builder.build_phase2_context(
+            finding, phase1_context
+        )
+        optimized_context = self.token_optimizer.optimize_context(phase2_context)
+
+        system_prompt = self.prompt_builder.build_fused_system_prompt()
+        # 最適化後のコンテキストは対象関数と追加情報の両方を含む
+        user_prompt = self.prompt_builder.build_fused_prompt(
+            finding, optimized_context, optimized_context
+        )
+
+        try:
+            response = self.llm_client.classify(system_prompt, user_prompt)
+        except LLMError as e:
+            return self.response_parser.create_error_result(
+                finding.id, str(e), 2
+            )
+
+        if response is None:
+            return self.response_parser.create_error_result(
+                finding.id, "LLM応答なし", 2
+            )
+
+        result = self.response_parser.parse(response, finding.id, phase=2)
+
+        logger.debug(
+            f"  Fused call resolved: {result.classification.value} "
+            f"({result.confidence:.0%})"
+        )
+
+        return result
+
     def _log_statistics(self) -> None:
         """処理統計をログ出力する。"""
         logger.info("=" * 50)
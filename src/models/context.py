@@ -1,10 +1,21 @@
 """LLM解析用のコンテキストモデル。"""
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Sequence
 
+# フィールド名のタプルをモジュール定数として固定する
+# （dataclasses.fields()/asdict()の都度呼び出しより大幅に速い）
+_FUNCTION_INFO_FIELDS = (
+    "name", "file_path", "start_line", "end_line",
+    "code", "signature", "return_type", "parameters",
+)
+_ANALYSIS_CONTEXT_FIELDS = (
+    "target_function", "finding_line", "rule_info",
+    "caller_functions", "related_types", "related_macros",
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class FunctionInfo:
     """ソースコードから抽出した関数情報。"""
     name: str
@@ -14,17 +25,29 @@ class FunctionInfo:
     code: str
     signature: Optional[str] = None
     return_type: Optional[str] = None
-    parameters: List[str] = field(default_factory=list)
+    # 空の場合は共有の空タプル（インスタンスごとのリスト割り当てを回避）
+    parameters: Sequence[str] = ()
 
     def line_count(self) -> int:
         """関数の行数を取得する。"""
         return self.end_line - self.start_line + 1
 
+    def to_dict(self) -> dict:
+        """フィールド名から値への辞書を返す（浅いコピー）。
+
+        dataclasses.asdict()のフィールド走査・再帰コピーを避け、
+        固定のフィールド名タプルから直接属性を読む。
+
+        Returns:
+            フィールド名→値の辞書
+        """
+        return {name: getattr(self, name) for name in _FUNCTION_INFO_FIELDS}
+
     def __str__(self) -> str:
         return f"{self.name} ({self.file_path}:{self.start_line}-{self.end_line})"
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeDefinition:
     """型定義情報（class, struct, enum, typedef）。"""
     name: str
@@ -37,7 +60,7 @@ class TypeDefinition:
         return f"{self.kind} {self.name} ({self.file_path}:{self.line})"
 
 
-@dataclass
+@dataclass(slots=True)
 class MacroDefinition:
     """マクロ定義情報。"""
     name: str
@@ -51,33 +74,39 @@ class MacroDefinition:
         return f"#define {self.name} ({macro_type}, {self.file_path}:{self.line})"
 
 
-@dataclass
+@dataclass(slots=True)
 class RuleInfo:
     """ルールデータベースからのルール情報。"""
     rule_id: str
     title: str
     category: str  # Required, Advisory など
     rationale: str
-    false_positive_hints: List[str] = field(default_factory=list)
+    false_positive_hints: Sequence[str] = ()
 
-    def to_prompt_text(self) -> str:
-        """LLMプロンプト用のテキストに変換する。
+    # to_prompt_text()の結果（純粋関数のため構築時に1回だけ整形する）
+    _prompt_text: str = field(init=False, repr=False, compare=False)
 
-        Returns:
-            フォーマット済みのルール情報文字列
-        """
+    def __post_init__(self):
         hints_text = ""
         if self.false_positive_hints:
             hints_text = "\n**誤検知の可能性があるケース**:\n"
             hints_text += "\n".join(f"- {hint}" for hint in self.false_positive_hints)
 
-        return f"""**ルールID**: {self.rule_id}
+        self._prompt_text = f"""**ルールID**: {self.rule_id}
 **タイトル**: {self.title}
 **カテゴリ**: {self.category}
 **根拠**: {self.rationale}{hints_text}"""
 
+    def to_prompt_text(self) -> str:
+        """LLMプロンプト用のテキストに変換する。
+
+        Returns:
+            フォーマット済みのルール情報文字列（構築時に整形済み）
+        """
+        return self._prompt_text
+
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisContext:
     """LLM分類用の解析コンテキスト。
 
@@ -90,9 +119,19 @@ class AnalysisContext:
     rule_info: Optional[RuleInfo] = None
 
     # Phase 2 追加コンテキスト
-    caller_functions: List[FunctionInfo] = field(default_factory=list)
-    related_types: List[TypeDefinition] = field(default_factory=list)
-    related_macros: List[MacroDefinition] = field(default_factory=list)
+    # 空の場合は共有の空タプル（追加時はリストを代入する）
+    caller_functions: Sequence[FunctionInfo] = ()
+    related_types: Sequence[TypeDefinition] = ()
+    related_macros: Sequence[MacroDefinition] = ()
+
+    # estimate_tokens()の結果キャッシュ（構築後の変更時はinvalidate_token_cache()）
+    _token_estimate: Optional[int] = field(default=None, init=False, repr=False)
+
+    # 各要素のコード文字数を平坦に並べたキャッシュ（SoA形式）
+    # オブジェクト横断の属性参照を繰り返さずに一括集計できる
+    _code_lengths: Optional[List[int]] = field(
+        default=None, init=False, repr=False
+    )
 
     def relative_finding_line(self) -> int:
         """関数開始位置からの相対的な指摘行を取得する。
@@ -106,19 +145,73 @@ class AnalysisContext:
         """このコンテキストのトークン数を推定する。
 
         日本語/コード混在で1トークン≒3文字として概算。
+        結果はインスタンスにキャッシュされ、2回目以降はO(1)で返る。
+        コンテキストを変更した場合はinvalidate_token_cache()を呼ぶこと。
 
         Returns:
             推定トークン数
         """
-        total_chars = len(self.target_function.code)
-        total_chars += sum(len(f.code) for f in self.caller_functions)
-        total_chars += sum(len(t.code) for t in self.related_types)
-        total_chars += sum(len(m.definition) for m in self.related_macros)
+        if self._token_estimate is not None:
+            return self._token_estimate
+
+        # C実装のsumで平坦な長さ配列を一括集計する
+        self._token_estimate = sum(self.code_lengths()) // 3
+        return self._token_estimate
+
+    def code_lengths(self) -> List[int]:
+        """構成要素ごとのコード文字数を平坦なリストで返す。
+
+        対象関数・呼び出し元・型・マクロ・ルール情報の順に文字数を
+        並べたリストをキャッシュする。オブジェクトの属性を個別に
+        たどらず、intの並びとして一括集計・ベクトル化できる。
+
+        Returns:
+            各要素の文字数リスト
+        """
+        lengths = self._code_lengths
+        if lengths is not None:
+            return lengths
+
+        # ジェネレータ式のフレーム生成を避け、lenをローカルに束縛した
+        # 単純ループで構築する
+        code_len = len
+        lengths = [code_len(self.target_function.code)]
+        append = lengths.append
+        for f in self.caller_functions:
+            append(code_len(f.code))
+        for t in self.related_types:
+            append(code_len(t.code))
+        for m in self.related_macros:
+            append(code_len(m.definition))
 
         if self.rule_info:
-            total_chars += len(self.rule_info.to_prompt_text())
+            append(code_len(self.rule_info.to_prompt_text()))
 
-        return total_chars // 3
+        self._code_lengths = lengths
+        return lengths
+
+    def invalidate_token_cache(self) -> None:
+        """トークン推定のキャッシュを破棄する。
+
+        コンテキストの内容（対象関数・呼び出し元・型・マクロ）を
+        構築後に変更した場合に呼び出す。
+        """
+        self._token_estimate = None
+        self._code_lengths = None
+
+    def to_dict(self) -> dict:
+        """フィールド名から値への辞書を返す（浅いコピー）。
+
+        ネストしたモデルは再帰変換せずそのまま返す。
+        dataclasses.asdict()より軽量で、slots化された属性の
+        直接読み出しだけで済む。
+
+        Returns:
+            フィールド名→値の辞書
+        """
+        return {
+            name: getattr(self, name) for name in _ANALYSIS_CONTEXT_FIELDS
+        }
 
     def has_additional_context(self) -> bool:
         """Phase 2コンテキストが存在するかを確認する。
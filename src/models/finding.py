@@ -2,20 +2,64 @@
 
 from dataclasses import dataclass
 from typing import Optional
-from enum import Enum
+from enum import IntEnum
+import functools
 import os
-
-
-class Severity(Enum):
-    """CodeSonarの重大度レベル。"""
-    CRITICAL = "critical"
-    HIGH = "high"
-    MEDIUM = "medium"
-    LOW = "low"
-    INFO = "info"
-
-
-@dataclass
+import sys
+
+# os.path.normpathのメモ化版（同じ~100ファイルのパスが数千回現れるため）
+_normpath_cached = functools.lru_cache(maxsize=4096)(os.path.normpath)
+
+# 生パス→正規化・intern済みパスのキャッシュ
+# 数千件の指摘が少数のソースファイルを指すため、正規化の重複実行と
+# 同一パス文字列の重複保持を避ける
+_PATH_CACHE: dict = {}
+
+
+class Severity(IntEnum):
+    """CodeSonarの重大度レベル。
+
+    int値のため順序比較（severity >= Severity.HIGH等）と
+    辞書キーとしてのハッシュがintと同等のコストで済む。
+    """
+    INFO = 1
+    LOW = 2
+    MEDIUM = 3
+    HIGH = 4
+    CRITICAL = 5
+
+    @property
+    def label(self) -> str:
+        """プロンプト・出力用の小文字ラベル（例: "high"）。"""
+        return self.name.lower()
+
+
+# 重大度表現→Severityのマッピング（行ごとの辞書再構築を避けるためモジュール定数）
+_SEVERITY_MAP = {
+    "critical": Severity.CRITICAL,
+    "high": Severity.HIGH,
+    "medium": Severity.MEDIUM,
+    "low": Severity.LOW,
+    "info": Severity.INFO,
+    "information": Severity.INFO,
+    "1": Severity.CRITICAL,
+    "2": Severity.HIGH,
+    "3": Severity.MEDIUM,
+    "4": Severity.LOW,
+    "5": Severity.INFO,
+}
+
+# 数値コード1〜5に対応するSeverity（インデックス直接参照用）
+_INT_SEVERITY = (
+    Severity.CRITICAL,
+    Severity.HIGH,
+    Severity.MEDIUM,
+    Severity.LOW,
+    Severity.INFO,
+)
+
+
+@dataclass(slots=True)
 class SourceLocation:
     """ソースコードの位置情報。"""
     file_path: str
@@ -23,8 +67,12 @@ class SourceLocation:
     column: Optional[int] = None
 
     def __post_init__(self):
-        # Windowsパスを正規化
-        self.file_path = os.path.normpath(self.file_path)
+        # Windowsパスを正規化し、intern済みの共有文字列に置き換える
+        path = _PATH_CACHE.get(self.file_path)
+        if path is None:
+            path = sys.intern(_normpath_cached(self.file_path))
+            _PATH_CACHE[self.file_path] = path
+        self.file_path = path
 
     def __str__(self) -> str:
         if self.column:
@@ -32,7 +80,7 @@ class SourceLocation:
         return f"{self.file_path}:{self.line}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     """静的解析の指摘情報。"""
     id: str
@@ -71,6 +119,112 @@ class Finding:
             procedure=row.get("Procedure", row.get("Function"))
         )
 
+    @classmethod
+    def _fast_new(
+        cls,
+        id: str,
+        file_path_normed: str,
+        line: int,
+        rule_id: str,
+        message: str,
+        severity: Severity,
+        procedure: Optional[str],
+    ) -> "Finding":
+        """正規化済みパス前提の高速コンストラクタ。
+
+        object.__new__と直接の属性代入でdataclassの__init__/
+        __post_init__をバイパスする。パス正規化を列単位で済ませた
+        一括生成（from_dataframe）専用。
+
+        Args:
+            id: 指摘ID
+            file_path_normed: 正規化済みのファイルパス
+            line: 行番号
+            rule_id: ルールID
+            message: 指摘メッセージ
+            severity: 重大度
+            procedure: 関数名（省略可）
+
+        Returns:
+            Findingインスタンス
+        """
+        location = object.__new__(SourceLocation)
+        location.file_path = file_path_normed
+        location.line = line
+        location.column = None
+
+        finding = object.__new__(cls)
+        finding.id = id
+        finding.location = location
+        finding.rule_id = rule_id
+        finding.message = message
+        finding.severity = severity
+        finding.procedure = procedure
+        finding.function_code = None
+        finding.function_start_line = None
+        finding.function_end_line = None
+        return finding
+
+    @classmethod
+    def from_dataframe(cls, df, column_map: dict) -> list:
+        """DataFrame全体からFindingのリストを一括生成する。
+
+        行ごとの辞書生成とSeriesアクセスを避け、列単位でリストに
+        展開してからzipで構築する。パス正規化はpandasのC実装ループで
+        列ごとに1回だけ行う。
+
+        Args:
+            df: 指摘データのDataFrame
+            column_map: 標準名（file/line/rule/message等）→実際の列名の辞書
+
+        Returns:
+            Findingインスタンスのリスト
+        """
+        import pandas as pd
+
+        row_count = len(df)
+        files = df[column_map["file"]].astype(str).map(_normpath_cached).tolist()
+        lines = df[column_map["line"]].tolist()
+        rules = df[column_map["rule"]].astype(str).tolist()
+        messages = df[column_map["message"]].astype(str).tolist()
+
+        if "severity" in column_map:
+            parse_severity = cls._parse_severity
+            severities = [
+                parse_severity(v) for v in df[column_map["severity"]].tolist()
+            ]
+        else:
+            severities = [Severity.MEDIUM] * row_count
+
+        if "procedure" in column_map:
+            notna = pd.notna
+            procedures = [
+                str(v) if notna(v) else None
+                for v in df[column_map["procedure"]].tolist()
+            ]
+        else:
+            procedures = [None] * row_count
+
+        findings = []
+        append = findings.append
+        fast_new = cls._fast_new
+        for row_index, file_path, line, rule, message, severity, procedure in zip(
+            df.index.tolist(), files, lines, rules, messages, severities, procedures
+        ):
+            # Excelの行は1始まり、ヘッダー行も含む
+            excel_row = row_index + 2
+            append(fast_new(
+                f"F{excel_row:05d}",
+                file_path,
+                int(line),
+                rule,
+                message,
+                severity,
+                procedure,
+            ))
+
+        return findings
+
     @staticmethod
     def _parse_severity(value) -> Severity:
         """文字列または数値から重大度をパースする。
@@ -84,23 +238,17 @@ class Finding:
         if value is None:
             return Severity.MEDIUM
 
-        value_str = str(value).lower().strip()
-
-        mapping = {
-            "critical": Severity.CRITICAL,
-            "high": Severity.HIGH,
-            "medium": Severity.MEDIUM,
-            "low": Severity.LOW,
-            "info": Severity.INFO,
-            "information": Severity.INFO,
-            "1": Severity.CRITICAL,
-            "2": Severity.HIGH,
-            "3": Severity.MEDIUM,
-            "4": Severity.LOW,
-            "5": Severity.INFO,
-        }
-
-        return mapping.get(value_str, Severity.MEDIUM)
+        # 数値コード（1〜5）はインデックスで直接引く
+        if isinstance(value, int) and 1 <= value <= 5:
+            return _INT_SEVERITY[value - 1]
+
+        # 既に小文字の文字列なら正規化をスキップして直接引く
+        if type(value) is str:
+            severity = _SEVERITY_MAP.get(value)
+            if severity is not None:
+                return severity
+
+        return _SEVERITY_MAP.get(str(value).lower().strip(), Severity.MEDIUM)
 
     def __str__(self) -> str:
         return f"[{self.id}] {self.rule_id} at {self.location}: {self.message[:50]}..."
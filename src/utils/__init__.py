@@ -2,5 +2,6 @@
 
 from .logger import setup_logging
 from .retry import retry_with_backoff, retry_api_call
+from .rate_limiter import TokenBucket
 
-__all__ = ["setup_logging", "retry_with_backoff", "retry_api_call"]
+__all__ = ["setup_logging", "retry_with_backoff", "retry_api_call", "TokenBucket"]
@@ -1,16 +1,34 @@
 """ロギング設定モジュール。"""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
+# ファイル出力を担うバックグラウンドリスナー（setup_loggingで管理）
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """ファイル出力用のリスナーを停止し、キューをフラッシュする。"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
 
 def setup_logging(
     level: str = "INFO",
     log_file: Optional[str] = None,
-    format_string: Optional[str] = None
+    format_string: Optional[str] = None,
+    fast: bool = False
 ) -> logging.Logger:
     """ロギング設定をセットアップする。
 
@@ -18,21 +36,33 @@ def setup_logging(
         level: ログレベル（DEBUG, INFO, WARNING, ERROR, CRITICAL）
         log_file: ログファイルへのパス（省略可）
         format_string: カスタムフォーマット文字列（省略可）
+        fast: Trueの場合はタイムスタンプを省いた軽量フォーマットを使用
+            （レコードごとのlocaltime/strftimeを回避）
 
     Returns:
         ルートロガー
     """
+    # 使われないレコードフィールドの収集を止める
+    # （レコードごとのスレッド/プロセス情報取得とfindCallerを省く）
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
+
     # デフォルトフォーマット
     if format_string is None:
-        format_string = (
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
+        if fast:
+            format_string = "%(levelname)s %(name)s: %(message)s"
+        else:
+            format_string = (
+                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+            )
 
     # レベル文字列をロギングレベルに変換
     log_level = getattr(logging, level.upper(), logging.INFO)
 
-    # フォーマッターを作成
-    formatter = logging.Formatter(format_string)
+    # フォーマッターを作成（フォーマットは固定なのでvalidate不要）
+    formatter = logging.Formatter(format_string, validate=False)
 
     # ルートロガーを設定
     root_logger = logging.getLogger()
@@ -48,6 +78,10 @@ def setup_logging(
     root_logger.addHandler(console_handler)
 
     # ファイルハンドラー（指定された場合）
+    # ディスク書き込みはバックグラウンドスレッドに委譲し、
+    # ホットパスのログ呼び出しはキューへのputだけにする
+    # （コンソールとファイルで行の順序が僅かに入れ替わることがある）
+    _stop_queue_listener()
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
@@ -58,7 +92,19 @@ def setup_logging(
         )
         file_handler.setLevel(log_level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(log_level)
+        root_logger.addHandler(queue_handler)
+
+        global _queue_listener
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue,
+            file_handler,
+            respect_handler_level=True
+        )
+        _queue_listener.start()
 
     return root_logger
 
@@ -96,21 +142,32 @@ class ProgressLogger:
         self.current = 0
         self.logger = logger or logging.getLogger(__name__)
         self.log_interval = log_interval
-
-    def update(self, message: Optional[str] = None) -> None:
+        # 次にログを出すカウント値（毎回の剰余計算を避ける）
+        self._next_log_at = log_interval
+        # 進捗率計算用の逆数（除算を乗算に置き換える）
+        self._total_inv = 100.0 / total if total else 0.0
+        # ホットパスで使うメソッドを事前に束縛する
+        self._info = self.logger.info
+        self._enabled = self.logger.isEnabledFor
+
+    def update(self, message: Optional[str] = None, _INFO=logging.INFO) -> None:
         """進捗を更新する。
 
         Args:
             message: 含めるメッセージ（省略可）
         """
-        self.current += 1
-        progress = self.current / self.total * 100
-
-        if self.current % self.log_interval == 0 or self.current == self.total:
-            msg = f"Progress: {self.current}/{self.total} ({progress:.1f}%)"
-            if message:
-                msg += f" - {message}"
-            self.logger.info(msg)
+        cur = self.current + 1
+        self.current = cur
+
+        if cur >= self._next_log_at or cur == self.total:
+            self._next_log_at = cur + self.log_interval
+            if self._enabled(_INFO):
+                self._info(
+                    "Progress: %d/%d (%.1f%%)%s",
+                    cur, self.total,
+                    cur * self._total_inv,
+                    f" - {message}" if message else ""
+                )
 
     def complete(self, message: str = "Complete") -> None:
         """進捗を完了としてマークする。
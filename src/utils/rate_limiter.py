@@ -0,0 +1,66 @@
+"""トークンバケット方式のレートリミッター。"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """API呼び出しのレート制限用トークンバケット。
+
+    リクエストごとの固定スリープと異なり、呼び出し間隔が空いた分の
+    トークンをバケットに貯められるため、Clang解析やPhase 2構築で
+    間隔が空いた後の連続呼び出しを待ち時間なしで通せる。
+    スレッドセーフなので将来の並列化でもそのまま使用できる。
+    """
+
+    def __init__(self, rate: float, capacity: float = 3.0):
+        """トークンバケットを初期化する。
+
+        Args:
+            rate: 1秒あたりに補充されるトークン数（リクエスト/秒）
+            capacity: バケットの最大トークン数（バースト許容量）
+
+        Raises:
+            ValueError: rateが0以下の場合
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive: {rate}")
+
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """トークンを取得する。不足している場合は補充まで待機する。
+
+        Args:
+            tokens: 取得するトークン数
+
+        Returns:
+            待機した秒数
+        """
+        with self._lock:
+            self._refill()
+
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+
+            wait_time = (tokens - self._tokens) / self.rate
+
+        time.sleep(wait_time)
+
+        with self._lock:
+            self._refill()
+            self._tokens = max(0.0, self._tokens - tokens)
+
+        return wait_time
+
+    def _refill(self) -> None:
+        """経過時間に応じてトークンを補充する（ロック保持中に呼ぶこと）。"""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._last_refill = now
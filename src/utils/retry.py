@@ -7,6 +7,15 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# API系の例外はモジュール読み込み時に1回だけ解決する
+try:
+    from openai import RateLimitError, APIError, APIConnectionError
+    _API_EXCEPTIONS: Tuple[Type[Exception], ...] = (
+        RateLimitError, APIError, APIConnectionError
+    )
+except ImportError:
+    _API_EXCEPTIONS = (Exception,)
+
 
 def retry_with_backoff(
     max_retries: int = 3,
@@ -33,6 +42,8 @@ def retry_with_backoff(
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
             last_exception = None
+            # 指数バックオフは累積乗算で計算（べき乗演算を避ける）
+            delay = base_delay
 
             for attempt in range(max_retries + 1):
                 try:
@@ -47,21 +58,23 @@ def retry_with_backoff(
                         )
                         raise
 
-                    # 指数バックオフで遅延を計算
-                    delay = min(
-                        base_delay * (exponential_base ** attempt),
-                        max_delay
-                    )
-
-                    logger.warning(
-                        f"Attempt {attempt + 1}/{max_retries + 1} failed for "
-                        f"{func.__name__}: {e}. Retrying in {delay:.1f}s..."
-                    )
+                    wait_time = min(delay, max_delay)
+                    delay *= exponential_base
+
+                    # 遅延評価の%スタイル引数で、WARNINGが無効なら
+                    # メッセージ整形自体をスキップする
+                    if logger.isEnabledFor(logging.WARNING):
+                        logger.warning(
+                            "Attempt %d/%d failed for %s: %s. "
+                            "Retrying in %.1fs...",
+                            attempt + 1, max_retries + 1,
+                            func.__name__, e, wait_time
+                        )
 
                     if on_retry:
                         on_retry(e, attempt)
 
-                    time.sleep(delay)
+                    time.sleep(wait_time)
 
             raise last_exception
 
@@ -81,20 +94,14 @@ def retry_api_call(max_retries: int = 3, base_delay: float = 2.0):
     Returns:
         デコレートされた関数
     """
-    try:
-        from openai import RateLimitError, APIError, APIConnectionError
-        api_exceptions = (RateLimitError, APIError, APIConnectionError)
-    except ImportError:
-        api_exceptions = (Exception,)
-
     def log_retry(e: Exception, attempt: int) -> None:
-        logger.info(f"API retry triggered: {type(e).__name__}")
+        logger.info("API retry triggered: %s", type(e).__name__)
 
     return retry_with_backoff(
         max_retries=max_retries,
         base_delay=base_delay,
         max_delay=60.0,
-        exceptions=api_exceptions,
+        exceptions=_API_EXCEPTIONS,
         on_retry=log_retry
     )
 
@@ -111,6 +118,8 @@ class RetryState:
         self.max_retries = max_retries
         self.attempt = 0
         self.last_error: Optional[Exception] = None
+        # 指数バックオフの係数（record_attemptごとに倍にする）
+        self._backoff_factor = 1.0
 
     def should_retry(self) -> bool:
         """リトライすべきかを確認する。
@@ -126,6 +135,8 @@ class RetryState:
         Args:
             error: 試行中のエラー（もしあれば）
         """
+        if self.attempt > 0:
+            self._backoff_factor *= 2.0
         self.attempt += 1
         if error:
             self.last_error = error
@@ -139,9 +150,10 @@ class RetryState:
         Returns:
             遅延（秒）
         """
-        return min(base_delay * (2 ** (self.attempt - 1)), 60.0)
+        return min(base_delay * self._backoff_factor, 60.0)
 
     def reset(self) -> None:
         """リトライ状態をリセットする。"""
         self.attempt = 0
         self.last_error = None
+        self._backoff_factor = 1.0
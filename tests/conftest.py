@@ -0,0 +1,29 @@
+"""pytest共通設定。"""
+
+import os
+import shutil
+import tempfile
+
+# Linuxのtmpfsマウント。ここに一時ディレクトリを置くと
+# テスト中のmkdir/write/readがディスクではなくRAMに当たる
+_TMPFS_DIR = "/dev/shm"
+
+
+def pytest_configure(config):
+    """一時ディレクトリをtmpfs上に配置する。
+
+    --basetempが明示されておらず/dev/shmが書き込み可能な場合のみ、
+    tmp_path系フィクスチャの基底をtmpfs上に切り替える。
+    それ以外の環境では通常の一時ディレクトリのまま動作する。
+    """
+    if config.option.basetemp is None and os.access(_TMPFS_DIR, os.W_OK):
+        basetemp = tempfile.mkdtemp(prefix="pytest-", dir=_TMPFS_DIR)
+        config.option.basetemp = basetemp
+        config._tmpfs_basetemp = basetemp
+
+
+def pytest_unconfigure(config):
+    """tmpfs上に作成した一時ディレクトリを削除する。"""
+    basetemp = getattr(config, "_tmpfs_basetemp", None)
+    if basetemp is not None:
+        shutil.rmtree(basetemp, ignore_errors=True)